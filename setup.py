@@ -34,6 +34,11 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # Faster names/cities/phone numbers for the multi-format documents;
+        # generators.py falls back to Faker when it is not installed
+        "mimesis": ["mimesis"],
+    },
     entry_points={
         "console_scripts": [
             "casegen=main:main",
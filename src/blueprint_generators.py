@@ -4,6 +4,7 @@ Based on fabrication blueprints from actual case files.
 """
 import random
 from datetime import datetime, timedelta
+from itertools import accumulate
 from typing import List, Dict, Optional, Tuple
 from faker import Faker
 from .date_formatter import DateFormatter
@@ -20,6 +21,15 @@ except ImportError:
 
 fake = Faker()
 
+# Weighted samplers for carrier records, precomputed as (population, cumulative weights)
+# Provider selection with weighted probability (AT&T most common; Cricket is an AT&T subsidiary)
+_PROVIDER_WEIGHTS = {"AT&T": 0.4, "CRICKET": 0.2, "VERIZON": 0.3, "T-Mobile": 0.1}
+_PROVIDER_SAMPLER = (tuple(_PROVIDER_WEIGHTS), tuple(accumulate(_PROVIDER_WEIGHTS.values())))
+# Lower weight for late night/early morning, business hours (9 AM - 9 PM) favoured
+_CALL_HOUR_SAMPLER = (tuple(range(24)), tuple(accumulate([0.3] * 9 + [1.0] * 12 + [0.3] * 3)))
+# Status distribution (most calls pass)
+_ATTEST_STATUS_SAMPLER = (("Pass", "No", "Fail"), tuple(accumulate([0.85, 0.10, 0.05])))
+
 
 class RMSIncidentReportGenerator:
     """Generates RMS-style incident reports following blueprint specifications."""
@@ -492,17 +502,8 @@ class CarrierRecordGenerator:
         self.matter_id = matter_id
         self.query_start = query_start
         self.query_end = query_end
-        # Provider selection with weighted probability (AT&T most common)
-        provider_weights = {
-            "AT&T": 0.4,
-            "CRICKET": 0.2,  # AT&T subsidiary
-            "VERIZON": 0.3,
-            "T-Mobile": 0.1
-        }
-        self.provider = random.choices(
-            list(provider_weights.keys()),
-            weights=list(provider_weights.values())
-        )[0]
+        providers, cum_weights = _PROVIDER_SAMPLER
+        self.provider = random.choices(providers, cum_weights=cum_weights)[0]
         
         # Generate consistent identifiers that will be reused across all documents
         self.imsi = f"310{random.randint(10, 99)}{random.randint(1000000000, 9999999999)}"  # 15 digits
@@ -562,12 +563,10 @@ class CarrierRecordGenerator:
         num_records = random.randint(5, 20)
         
         # Create realistic call patterns (more calls during business hours, fewer at night)
+        hours, hour_cum_weights = _CALL_HOUR_SAMPLER
+        statuses, status_cum_weights = _ATTEST_STATUS_SAMPLER
         for i in range(1, num_records + 1):
-            # Weight hours toward business hours (9 AM - 9 PM)
-            hour = random.choices(
-                list(range(24)),
-                weights=[0.3] * 9 + [1.0] * 12 + [0.3] * 3  # Lower weight for late night/early morning
-            )[0]
+            hour = random.choices(hours, cum_weights=hour_cum_weights)[0]
             
             conn_time = self.query_start + timedelta(
                 days=random.randint(0, (self.query_end - self.query_start).days),
@@ -586,11 +585,7 @@ class CarrierRecordGenerator:
             
             term_num = f"1{random.randint(5550100000, 5550199999)}"
             
-            # Status distribution (most calls pass)
-            status = random.choices(
-                ["Pass", "No", "Fail"],
-                weights=[0.85, 0.10, 0.05]
-            )[0]
+            status = random.choices(statuses, cum_weights=status_cum_weights)[0]
             
             attest_type = random.choice(["A", "B", "C"])
             
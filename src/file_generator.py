@@ -10,6 +10,21 @@ from faker import Faker
 
 fake = Faker()
 
+# Filename templates by document kind, formatted with the running file counter
+_FILENAME_TEMPLATES = {
+    "pdf": "document_%03d.pdf",
+    "docx": "document_%03d.docx",
+    "txt": "document_%03d.txt",
+    "xlsx": "data_%03d.xlsx",
+    "csv": "data_%03d.csv",
+    "financial_records": "financial_records_%03d.xlsx",
+    "evidence_log": "evidence_log_%03d.xlsx",
+    "phone_records": "phone_records_%03d.xlsx",
+    "incident_report": "incident_report_%03d.pdf",
+    "memo": "memo_%03d.docx",
+    "ransom_note": "ransom_note_%03d.txt",
+}
+
 
 class FileGenerator:
     """Generates actual files in various formats."""
@@ -18,6 +33,10 @@ class FileGenerator:
         self.output_dir = output_dir
         self.file_counter = 1
     
+    def _generate_filename(self, kind: str) -> str:
+        """Default filename for a document kind at the current counter."""
+        return _FILENAME_TEMPLATES[kind] % self.file_counter
+    
     def generate_pdf(self, content: str, filename: Optional[str] = None) -> str:
         """Generate a PDF file."""
         try:
@@ -26,7 +45,7 @@ class FileGenerator:
             from reportlab.lib.styles import getSampleStyleSheet
             
             if not filename:
-                filename = f"document_{self.file_counter:03d}.pdf"
+                filename = self._generate_filename("pdf")
             filepath = os.path.join(self.output_dir, filename)
             
             doc = SimpleDocTemplate(filepath, pagesize=letter)
@@ -53,7 +72,7 @@ class FileGenerator:
             from docx import Document
             
             if not filename:
-                filename = f"document_{self.file_counter:03d}.docx"
+                filename = self._generate_filename("docx")
             filepath = os.path.join(self.output_dir, filename)
             
             doc = Document()
@@ -78,7 +97,7 @@ class FileGenerator:
             from openpyxl import Workbook
             
             if not filename:
-                filename = f"data_{self.file_counter:03d}.xlsx"
+                filename = self._generate_filename("xlsx")
             filepath = os.path.join(self.output_dir, filename)
             
             wb = Workbook()
@@ -103,7 +122,7 @@ class FileGenerator:
         import csv
         
         if not filename:
-            filename = f"data_{self.file_counter:03d}.csv"
+            filename = self._generate_filename("csv")
         filepath = os.path.join(self.output_dir, filename)
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -117,7 +136,7 @@ class FileGenerator:
     def generate_txt(self, content: str, filename: Optional[str] = None) -> str:
         """Generate a text file."""
         if not filename:
-            filename = f"document_{self.file_counter:03d}.txt"
+            filename = self._generate_filename("txt")
         filepath = os.path.join(self.output_dir, filename)
         
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -150,7 +169,7 @@ class FileGenerator:
             
             data.append([date, random.choice(descriptions), f"{amount:.2f}", account, category, f"{balance:.2f}"])
         
-        return self.generate_xlsx(data, headers, f"financial_records_{self.file_counter:03d}.xlsx")
+        return self.generate_xlsx(data, headers, self._generate_filename("financial_records"))
     
     def generate_evidence_log_xlsx(self, evidence_items: List[Dict]) -> str:
         """Generate evidence log as XLSX."""
@@ -173,7 +192,7 @@ class FileGenerator:
             
             data.append([evid_id, evid_type, description, location, date, officer, status])
         
-        return self.generate_xlsx(data, headers, f"evidence_log_{self.file_counter:03d}.xlsx")
+        return self.generate_xlsx(data, headers, self._generate_filename("evidence_log"))
     
     def generate_phone_records_xlsx(self, num_calls: int = 100) -> str:
         """Generate phone records as XLSX."""
@@ -191,17 +210,17 @@ class FileGenerator:
             
             data.append([date, time, str(duration), from_num, to_num, call_type, location])
         
-        return self.generate_xlsx(data, headers, f"phone_records_{self.file_counter:03d}.xlsx")
+        return self.generate_xlsx(data, headers, self._generate_filename("phone_records"))
     
     def generate_incident_report_pdf(self, content: str) -> str:
         """Generate incident report as PDF."""
-        return self.generate_pdf(content, f"incident_report_{self.file_counter:03d}.pdf")
+        return self.generate_pdf(content, self._generate_filename("incident_report"))
     
     def generate_memo_docx(self, content: str) -> str:
         """Generate memo as DOCX."""
-        return self.generate_docx(content, f"memo_{self.file_counter:03d}.docx")
+        return self.generate_docx(content, self._generate_filename("memo"))
     
     def generate_ransom_note_txt(self, content: str) -> str:
         """Generate ransom note as TXT."""
-        return self.generate_txt(content, f"ransom_note_{self.file_counter:03d}.txt")
+        return self.generate_txt(content, self._generate_filename("ransom_note"))
 
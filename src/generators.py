@@ -1,10 +1,14 @@
 from datetime import datetime, timedelta
 import random
+import io
 import json
 import os
 import tempfile
-from typing import List, Dict, Optional
-from faker import Faker
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Dict, Optional, Tuple
 
 from .models import Case, Person, Role, IncidentReport, Evidence, EvidenceType, DigitalDevice, Weapon
 from .realistic_errors import RealisticErrorGenerator, EventType, ErrorSeverity
@@ -26,7 +30,7 @@ from .utils import (
     generate_soil_analysis_report, generate_infotainment_log, generate_predictive_policing_report,
     generate_cad_log,
     generate_evidence_bagging_log, generate_discovery_index,
-    d20, roll_check
+    d20, roll_check, _faker
 )
 
 
@@ -161,7 +165,214 @@ class TempFileManager:
             self.cleanup_case(case_id, archive)
 
 
-fake = Faker()
+class _FakeFrontend:
+    """
+    Faker front-end that serves the high-volume multi-format fields from Mimesis
+    when it is installed, limited to fields whose output matches Faker's format.
+    Every other attribute (addresses, companies, UUIDs, ...) is delegated to Faker.
+    Both backends are created on first use rather than at import time.
+    """
+
+    def __init__(self):
+        self._faker = None
+        self._mi = None
+
+    def _backends(self):
+        """Return (faker, mimesis-or-None), creating them on first call."""
+        if self._faker is None:
+            try:
+                from mimesis import Generic
+                from mimesis.locales import Locale
+                self._mi = Generic(locale=Locale.EN)
+            except ImportError:
+                # Fallback to Faker for everything if mimesis not available
+                self._mi = None
+            # Share the package's Faker instance rather than building a second one
+            self._faker = _faker()
+        return self._faker, self._mi
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._backends()[0], name)
+
+    def reseed(self, seed: int):
+        """Reseed both backends (used by worker processes to avoid correlated output)."""
+        faker, mi = self._backends()
+        type(faker).seed(seed)
+        if mi:
+            mi.reseed(seed)
+
+    def name(self) -> str:
+        faker, mi = self._backends()
+        return mi.person.full_name() if mi else faker.name()
+
+    def city(self) -> str:
+        faker, mi = self._backends()
+        return mi.address.city() if mi else faker.city()
+
+    def state_abbr(self) -> str:
+        faker, mi = self._backends()
+        return mi.address.state(abbr=True) if mi else faker.state_abbr()
+
+    def phone_number(self) -> str:
+        faker, mi = self._backends()
+        return mi.person.phone_number(mask="###-###-####") if mi else faker.phone_number()
+
+    def street_name(self) -> str:
+        faker, mi = self._backends()
+        return mi.address.street_name() if mi else faker.street_name()
+
+    def date(self) -> str:
+        faker, mi = self._backends()
+        return mi.datetime.date().isoformat() if mi else faker.date()
+
+
+fake = _FakeFrontend()
+
+# Separator rules used by the multi-format plain-text documents
+_EQ50 = "=" * 50
+_EQ60 = "=" * 60
+_DASH50 = "-" * 50
+_DASH60 = "-" * 60
+_DASH80 = "-" * 80
+_DASH100 = "-" * 100
+
+# Row templates for the CSV spreadsheet documents (one % per row, no per-field f-strings)
+_FINANCIAL_ROW = "%s,%s,%.2f,****%d,%s,%.2f\n"
+_EVIDENCE_ROW = "EVID-%d,%s,%s,%s,%s,%s,%s\n"
+_PHONE_ROW = "%s,%02d:%02d,%d,%s,%s,%s,%s\n"
+
+# Phrase pools for the multi-format documents. Entries with {placeholders} are
+# only formatted when that entry is actually drawn.
+_DISPATCHER_PHRASES = (
+    "911, what's your emergency?",
+    "Can you tell me what happened?",
+    "Where are you located?",
+    "Is anyone injured?",
+    "Stay on the line, help is on the way."
+)
+
+_CALLER_PHRASES = (
+    "I need help!",
+    "There's been an accident!",
+    "Someone broke into my house!",
+    "I'm at {address}",
+    "Please hurry!"
+)
+
+_WT_SPEAKER1 = (
+    "Meet me at {address}",
+    "The amount is ${amount}",
+    "Don't say anything over the phone",
+    "We'll handle it tonight"
+)
+
+_WT_SPEAKER2 = (
+    "Understood",
+    "I'll be there",
+    "What about the other thing?",
+    "Are you sure about this?"
+)
+
+_CCTV_EVENTS = (
+    "Person enters frame from left",
+    "Vehicle stops in parking lot",
+    "Subject exits vehicle",
+    "Subject approaches building entrance",
+    "Subject enters building",
+    "Subject exits building",
+    "Vehicle departs scene"
+)
+
+_CCTV_OBSERVATIONS_TMPL = (
+    "License plate visible: {plate}",
+    "Subject appears to be {sex}, approximately {age} years old",
+    "Vehicle: {body} - {color}",
+    "Subject wearing {clothing}"
+)
+
+_BODYCAM_OFFICER_PHRASES = (
+    "This is Officer {first_name}, responding to call",
+    "Show me your hands!",
+    "Stay where you are!",
+    "Put your hands behind your back",
+    "You're under arrest"
+)
+
+_BODYCAM_SUBJECT_PHRASES = (
+    "I didn't do anything!",
+    "What's this about?",
+    "I have rights!",
+    "You can't do this!"
+)
+
+_RANSOM_PHRASES = (
+    "We have {victim}. Do not contact police.",
+    "If you want {victim} back alive, follow instructions exactly.",
+    "Place {amount} in unmarked bills.",
+    "Wait for further instructions.",
+    "Tell no one or {victim} dies.",
+    "You have {hours} hours."
+)
+
+class _LazyFields(dict):
+    """Mapping for str.format_map() that builds each field on first reference."""
+
+    def __init__(self, **factories):
+        super().__init__()
+        self._factories = factories
+
+    def __missing__(self, key):
+        value = self[key] = self._factories[key]()
+        return value
+
+def _interleave(first: List[str], second: List[str]) -> List[str]:
+    """Alternate two speakers' lines, starting with the first (which may have one extra line)."""
+    lines = [line for pair in zip(first, second) for line in pair]
+    if len(first) > len(second):
+        lines.append(first[-1])
+    return lines
+
+# [epoch second, formatted timestamp] - reformatted at most once per second
+_now_cache = [0, ""]
+
+def _now_str() -> str:
+    """Current local time as YYYY-MM-DD HH:MM:SS, cached for the current second."""
+    now = int(time.time())
+    if now != _now_cache[0]:
+        _now_cache[0] = now
+        _now_cache[1] = datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S')
+    return _now_cache[1]
+
+def _recent_dates(max_days: int) -> Tuple[str, ...]:
+    """YYYY-MM-DD strings for today and each of the previous max_days days."""
+    return _date_pool(_now_str()[:10], max_days)
+
+@lru_cache(maxsize=8)
+def _date_pool(today: str, max_days: int) -> Tuple[str, ...]:
+    day = datetime.strptime(today, '%Y-%m-%d')
+    return tuple((day - timedelta(days=days)).strftime('%Y-%m-%d') for days in range(max_days + 1))
+
+def _financial_description(kind: int, rng: random.Random = random) -> str:
+    """Build one transaction description of the given kind (0-3)."""
+    if kind == 0:
+        return f"ATM WITHDRAWAL - {fake.city()}"
+    elif kind == 1:
+        return f"PURCHASE - {fake.company()}"
+    elif kind == 2:
+        return f"TRANSFER TO {fake.name()}"
+    return f"DEPOSIT - CHECK #{rng.randint(1000, 9999)}"
+
+def _random_phone_number(rng: random.Random = random) -> str:
+    """Random NXX-NXX-XXXX style number for phone record rows."""
+    return f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+def _make_evidence_pools() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Location and officer pools for a case's evidence logs."""
+    locations = tuple(fake.address() for _ in range(5))
+    officers = tuple(fake.name() for _ in range(3))
+    return locations, officers
 
 class EntityProfile:
     """Tracks attributes for document generators (officers, systems, AI, etc.)"""
@@ -337,11 +548,20 @@ class EntityProfile:
         return plate
 
 class CaseGenerator:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        seed: seeds the instance RNG (self.rng) used by the multi-format
+        documents. Everything else draws from the global random module and
+        Faker, which callers seed themselves (see _init_batch_worker).
+        Without a seed the instance RNG is seeded from os.urandom.
+        """
         self.case = None
         self.temp_manager = TempFileManager()
         self.current_case_id = None
         self.entities = {}  # Track all entities (officers, systems, etc.)
+        # Evidence-log pools and the case object they were drawn for
+        self._evidence_pools = None
+        self._evidence_pools_case = None
         if not hasattr(self, 'entities'):
             self.entities = {}
         
@@ -351,6 +571,11 @@ class CaseGenerator:
         self.entity_validator = None
         self.timeline_manager = None
         self.location_manager = None
+        
+        # Instance-local RNG for the multi-format documents only (no shared module state across threads)
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+        self.rng = random.Random(seed)
 
     def generate_case(self, crime_type: str, complexity: str, modifiers: List[str], subject_status: str = "Known", subject_clarity: str = None) -> Case:
         """Generate a complete case with comprehensive error handling."""
@@ -405,7 +630,9 @@ class CaseGenerator:
             self.location_manager = LocationManager()
             
             # Initialize realistic error generator
-            self.error_generator = RealisticErrorGenerator(crime_dt, complexity)
+            self.error_generator = RealisticErrorGenerator(
+                crime_dt, complexity, seed=self.rng.getrandbits(64)
+            )
             
             # 3. Initialize entity system (officers, systems, etc.)
             self._initialize_entities(case_id)
@@ -574,6 +801,18 @@ class CaseGenerator:
                 modifiers=modifiers
             )
 
+    def generate_batch(self, specs: List[Dict], max_workers: Optional[int] = None) -> List[Case]:
+        """
+        Generate many independent cases across worker processes.
+        Each spec is a dict of generate_case() keyword arguments; cases are returned in spec order.
+        """
+        if not specs:
+            return []
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(specs) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+            return list(executor.map(_generate_batch_case, specs, chunksize=chunksize))
+
     def _initialize_entities(self, case_id: str):
         """Initialize entity profiles for officers, systems, AI, etc. and store in temp file."""
         # Create entity profiles for common document generators
@@ -3122,347 +3361,320 @@ Date: {wreck_time.strftime('%Y-%m-%d %H:%M:%S')}
     
     def _generate_useful_multi_format_docs(self):
         """Generate useful multi-format documents: OCR, transcripts, CSV data, ransom notes."""
+        rng = self.rng
         # OCR from CCTV/license plates (only when useful)
-        if random.random() < 0.4:  # 40% chance
+        if rng.random() < 0.4:  # 40% chance
             self._generate_ocr_extraction()
         
         # Audio transcripts (actual dialogue)
-        if random.random() < 0.5:  # 50% chance for 911 calls
+        if rng.random() < 0.5:  # 50% chance for 911 calls
             self._generate_911_audio_transcript()
         
         # Wiretap transcripts (for certain crime types)
         if self.case.crime_type in ["Organized Crime", "Drug Possession", "Fraud"]:
-            if random.random() < 0.4:  # 40% chance
+            if rng.random() < 0.4:  # 40% chance
                 self._generate_wiretap_transcript()
         
         # Video transcripts (CCTV timeline, body cam)
-        if random.random() < 0.5:  # 50% chance
+        if rng.random() < 0.5:  # 50% chance
             self._generate_cctv_video_transcript()
         
-        if self.case.reporting_officer and random.random() < 0.4:  # 40% chance
+        if self.case.reporting_officer and rng.random() < 0.4:  # 40% chance
             self._generate_bodycam_transcript()
         
         # Spreadsheet data (actual CSV content)
         if "Financial Records" in self.case.modifiers or self.case.crime_type in ["Fraud"]:
-            if random.random() < 0.7:  # 70% chance
+            if rng.random() < 0.7:  # 70% chance
                 self._generate_financial_spreadsheet()
         
-        if len(self.case.evidence) > 5 and random.random() < 0.5:  # 50% chance
+        if len(self.case.evidence) > 5 and rng.random() < 0.5:  # 50% chance
             self._generate_evidence_log_spreadsheet()
         
-        if "Phone data pull" in self.case.modifiers and random.random() < 0.6:  # 60% chance
+        if "Phone data pull" in self.case.modifiers and rng.random() < 0.6:  # 60% chance
             self._generate_phone_records_spreadsheet()
         
         # Ransom notes (for kidnapping/extortion)
-        if self.case.crime_type in ["Kidnapping", "Extortion"] or random.random() < 0.1:
+        if self.case.crime_type in ["Kidnapping", "Extortion"] or rng.random() < 0.1:
             self._generate_ransom_note()
     
     def _generate_ocr_extraction(self):
         """Generate OCR text extraction from images (license plates, evidence markings)."""
-        doc = f"""--- OCR TEXT EXTRACTION ---
-File: CCTV_STILL_{random.randint(1, 99):03d}.jpg
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- OCR TEXT EXTRACTION ---
+File: CCTV_STILL_{rng.randint(1, 99):03d}.jpg
 Format: JPEG
 Date: {self.crime_datetime.strftime('%Y-%m-%d')}
 
 EXTRACTED TEXT:
-{'-' * 50}
-"""
+{_DASH50}
+""")
         # Extract license plate
-        if random.random() < 0.7:  # 70% chance of readable plate
-            plate = f"{random.randint(1, 9)}{random.choice(['ABC', 'DEF', 'GHI', 'JKL', 'MNO'])}{random.randint(100, 999)}"
-            confidence = random.randint(85, 99)
-            doc += f"License Plate: {plate} (Confidence: {confidence}%)\n\n"
+        if rng.random() < 0.7:  # 70% chance of readable plate
+            plate = f"{rng.randint(1, 9)}{rng.choice(['ABC', 'DEF', 'GHI', 'JKL', 'MNO'])}{rng.randint(100, 999)}"
+            confidence = rng.randint(85, 99)
+            w(f"License Plate: {plate} (Confidence: {confidence}%)\n\n")
         
         # Extract signage
-        if random.random() < 0.5:
-            signs = ["STOP", f"SPEED LIMIT {random.randint(15, 55)}", f"{fake.street_name()} STREET"]
-            doc += f"Signage: {random.choice(signs)}\n\n"
+        if rng.random() < 0.5:
+            signs = ["STOP", f"SPEED LIMIT {rng.randint(15, 55)}", f"{fake.street_name()} STREET"]
+            w(f"Signage: {rng.choice(signs)}\n\n")
         
-        doc += f"{'-' * 50}\n"
-        doc += f"OCR Confidence: {random.randint(75, 98)}%\n"
-        doc += f"Processing Method: {random.choice(['Tesseract OCR', 'Google Vision API', 'AWS Textract'])}\n"
+        w(f"{_DASH50}\n")
+        w(f"OCR Confidence: {rng.randint(75, 98)}%\n")
+        w(f"Processing Method: {rng.choice(['Tesseract OCR', 'Google Vision API', 'AWS Textract'])}\n")
         
-        self.case.documents.append(doc)
+        self.case.documents.append(buf.getvalue())
     
     def _generate_911_audio_transcript(self):
         """Generate actual 911 call transcript."""
-        dispatcher_phrases = [
-            "911, what's your emergency?",
-            "Can you tell me what happened?",
-            "Where are you located?",
-            "Is anyone injured?",
-            "Stay on the line, help is on the way."
-        ]
-        
-        caller_phrases = [
-            "I need help!",
-            "There's been an accident!",
-            "Someone broke into my house!",
-            f"I'm at {fake.address()}",
-            "Please hurry!"
-        ]
-        
-        transcript = f"""--- 911 CALL TRANSCRIPT ---
-File: 911_call_{random.randint(1, 99):03d}.wav
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- 911 CALL TRANSCRIPT ---
+File: 911_call_{rng.randint(1, 99):03d}.wav
 Format: WAV
-Duration: {random.choice(['00:02:15', '00:03:42', '00:01:58'])}
+Duration: {rng.choice(['00:02:15', '00:03:42', '00:01:58'])}
 Date: {self.crime_datetime.strftime('%Y-%m-%d %H:%M:%S')}
 
 TRANSCRIPT:
-{'=' * 60}
-"""
-        num_exchanges = random.randint(4, 8)
-        for i in range(num_exchanges):
-            if i % 2 == 0:
-                transcript += f"DISPATCHER: {random.choice(dispatcher_phrases)}\n"
-            else:
-                transcript += f"CALLER: {random.choice(caller_phrases)}\n"
+{_EQ60}
+""")
+        num_exchanges = rng.randint(4, 8)
+        dispatcher = [f"DISPATCHER: {phrase}\n" for phrase in rng.choices(_DISPATCHER_PHRASES, k=(num_exchanges + 1) // 2)]
+        caller = [
+            f"CALLER: {phrase.format(address=fake.address()) if '{address}' in phrase else phrase}\n"
+            for phrase in rng.choices(_CALLER_PHRASES, k=num_exchanges // 2)
+        ]
+        buf.writelines(_interleave(dispatcher, caller))
         
-        transcript += f"{'=' * 60}\n"
-        transcript += f"Quality Notes: {random.choice(['Clear audio', 'Some background noise', 'Caller emotional'])}\n"
+        w(f"{_EQ60}\n")
+        w(f"Quality Notes: {rng.choice(['Clear audio', 'Some background noise', 'Caller emotional'])}\n")
         
-        self.case.documents.append(transcript)
+        self.case.documents.append(buf.getvalue())
     
     def _generate_wiretap_transcript(self):
         """Generate actual wiretap transcript."""
-        speaker1_phrases = [
-            f"Meet me at {fake.address()}",
-            f"The amount is ${random.randint(1000, 50000)}",
-            "Don't say anything over the phone",
-            "We'll handle it tonight"
-        ]
-        
-        speaker2_phrases = [
-            "Understood",
-            "I'll be there",
-            "What about the other thing?",
-            "Are you sure about this?"
-        ]
-        
-        transcript = f"""--- WIRETAP TRANSCRIPT ---
-File: wiretap_{random.randint(1, 99):03d}.mp3
-Date: {(self.crime_datetime - timedelta(days=random.randint(1, 7))).strftime('%Y-%m-%d')}
-Duration: {random.choice(['00:15:32', '00:22:45', '00:18:12'])}
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- WIRETAP TRANSCRIPT ---
+File: wiretap_{rng.randint(1, 99):03d}.mp3
+Date: {(self.crime_datetime - timedelta(days=rng.randint(1, 7))).strftime('%Y-%m-%d')}
+Duration: {rng.choice(['00:15:32', '00:22:45', '00:18:12'])}
 
 TRANSCRIPT:
-{'=' * 60}
-"""
-        num_exchanges = random.randint(6, 12)
-        for i in range(num_exchanges):
-            speaker = "SPEAKER 1" if i % 2 == 0 else "SPEAKER 2"
-            phrases = speaker1_phrases if i % 2 == 0 else speaker2_phrases
-            transcript += f"{speaker}: {random.choice(phrases)}\n"
-        
-        transcript += f"{'=' * 60}\n"
-        transcript += f"Note: {random.choice(['Multiple speakers identified', 'Background noise present', 'Some portions unclear'])}\n"
-        
-        self.case.documents.append(transcript)
+{_EQ60}
+""")
+        num_exchanges = rng.randint(6, 12)
+        speaker1 = []
+        for phrase in rng.choices(_WT_SPEAKER1, k=(num_exchanges + 1) // 2):
+            if "{address}" in phrase:
+                phrase = phrase.format(address=fake.address())
+            elif "{amount}" in phrase:
+                phrase = phrase.format(amount=rng.randint(1000, 50000))
+            speaker1.append(f"SPEAKER 1: {phrase}\n")
+        speaker2 = [f"SPEAKER 2: {phrase}\n" for phrase in rng.choices(_WT_SPEAKER2, k=num_exchanges // 2)]
+        buf.writelines(_interleave(speaker1, speaker2))
+        
+        w(f"{_EQ60}\n")
+        w(f"Note: {rng.choice(['Multiple speakers identified', 'Background noise present', 'Some portions unclear'])}\n")
+        
+        self.case.documents.append(buf.getvalue())
     
     def _generate_cctv_video_transcript(self):
         """Generate CCTV video timeline transcript."""
-        transcript = f"""--- CCTV VIDEO ANALYSIS ---
-File: cctv_{random.randint(1, 99):03d}.mp4
-Duration: {random.choice(['00:34:15', '01:12:43', '00:45:22'])}
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- CCTV VIDEO ANALYSIS ---
+File: cctv_{rng.randint(1, 99):03d}.mp4
+Duration: {rng.choice(['00:34:15', '01:12:43', '00:45:22'])}
 Date: {self.crime_datetime.strftime('%Y-%m-%d')}
 
 TIMELINE OF EVENTS:
-{'=' * 60}
-"""
-        # Generate timeline events
-        times = []
-        for i in range(random.randint(3, 6)):
-            minutes = random.randint(0, 59)
-            hours = random.randint(8, 22)
-            times.append(f"{hours:02d}:{minutes:02d}")
-        
-        events = [
-            "Person enters frame from left",
-            "Vehicle stops in parking lot",
-            "Subject exits vehicle",
-            "Subject approaches building entrance",
-            "Subject enters building",
-            "Subject exits building",
-            "Vehicle departs scene"
-        ]
-        
-        for time in sorted(set(times)):
-            transcript += f"{time} - {random.choice(events)}\n"
-        
-        transcript += "\nKEY OBSERVATIONS:\n"
-        transcript += "-" * 60 + "\n"
-        
-        observations = [
-            f"License plate visible: {random.randint(1, 9)}{random.choice(['ABC', 'DEF', 'GHI'])}{random.randint(100, 999)}",
-            f"Subject appears to be {random.choice(['male', 'female'])}, approximately {random.randint(20, 60)} years old",
-            f"Vehicle: {random.choice(['Sedan', 'SUV', 'Truck'])} - {random.choice(['Black', 'White', 'Silver'])}",
-            f"Subject wearing {random.choice(['dark clothing', 'hoodie', 'jacket'])}"
-        ]
-        
-        for obs in random.sample(observations, random.randint(2, 4)):
-            transcript += f"- {obs}\n"
+{_EQ60}
+""")
+        # Generate timeline events: distinct minutes between 08:00 and 22:59, in order
+        minutes_of_day = sorted(rng.sample(range(8 * 60, 23 * 60), rng.randint(3, 6)))
+        for minute in minutes_of_day:
+            w(f"{minute // 60:02d}:{minute % 60:02d} - {rng.choice(_CCTV_EVENTS)}\n")
+        
+        w("\nKEY OBSERVATIONS:\n")
+        w(_DASH60 + "\n")
+        
+        for tmpl in rng.sample(_CCTV_OBSERVATIONS_TMPL, rng.randint(2, 4)):
+            if "{plate}" in tmpl:
+                obs = tmpl.format(plate=f"{rng.randint(1, 9)}{rng.choice(['ABC', 'DEF', 'GHI'])}{rng.randint(100, 999)}")
+            elif "{sex}" in tmpl:
+                obs = tmpl.format(sex=rng.choice(['male', 'female']), age=rng.randint(20, 60))
+            elif "{body}" in tmpl:
+                obs = tmpl.format(body=rng.choice(['Sedan', 'SUV', 'Truck']), color=rng.choice(['Black', 'White', 'Silver']))
+            else:
+                obs = tmpl.format(clothing=rng.choice(['dark clothing', 'hoodie', 'jacket']))
+            w(f"- {obs}\n")
         
-        transcript += "=" * 60 + "\n"
+        w(_EQ60 + "\n")
         
-        self.case.documents.append(transcript)
+        self.case.documents.append(buf.getvalue())
     
     def _generate_bodycam_transcript(self):
         """Generate body camera transcript."""
+        rng = self.rng
         if not self.case.reporting_officer:
             return
         
-        officer_phrases = [
-            f"This is Officer {self.case.reporting_officer.first_name}, responding to call",
-            "Show me your hands!",
-            "Stay where you are!",
-            "Put your hands behind your back",
-            "You're under arrest"
-        ]
-        
-        subject_phrases = [
-            "I didn't do anything!",
-            "What's this about?",
-            "I have rights!",
-            "You can't do this!"
-        ]
-        
-        transcript = f"""--- BODY CAMERA FOOTAGE TRANSCRIPT ---
-File: bodycam_{random.randint(1, 99):03d}.mp4
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- BODY CAMERA FOOTAGE TRANSCRIPT ---
+File: bodycam_{rng.randint(1, 99):03d}.mp4
 Officer: {self.case.reporting_officer.full_name}
 Date: {self.crime_datetime.strftime('%Y-%m-%d')}
 
 TRANSCRIPT:
-{'=' * 60}
-"""
-        num_exchanges = random.randint(5, 10)
-        for i in range(num_exchanges):
-            if i % 2 == 0:
-                transcript += f"OFFICER: {random.choice(officer_phrases)}\n"
-            else:
-                transcript += f"SUBJECT: {random.choice(subject_phrases)}\n"
+{_EQ60}
+""")
+        num_exchanges = rng.randint(5, 10)
+        first_name = self.case.reporting_officer.first_name
+        officer = [
+            f"OFFICER: {phrase.format(first_name=first_name)}\n"
+            for phrase in rng.choices(_BODYCAM_OFFICER_PHRASES, k=(num_exchanges + 1) // 2)
+        ]
+        subject = [f"SUBJECT: {phrase}\n" for phrase in rng.choices(_BODYCAM_SUBJECT_PHRASES, k=num_exchanges // 2)]
+        buf.writelines(_interleave(officer, subject))
         
-        transcript += "=" * 60 + "\n"
+        w(_EQ60 + "\n")
         
-        self.case.documents.append(transcript)
+        self.case.documents.append(buf.getvalue())
     
     def _generate_financial_spreadsheet(self):
         """Generate actual financial transaction CSV data."""
-        data = f"""--- FINANCIAL RECORDS (CSV DATA) ---
-File: financial_data_{random.randint(1, 99):03d}.xlsx
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- FINANCIAL RECORDS (CSV DATA) ---
+File: financial_data_{rng.randint(1, 99):03d}.xlsx
 Format: XLSX
 
 Date,Description,Amount,Account,Category,Balance
-{'-' * 80}
-"""
-        num_transactions = random.randint(20, 100)
-        balance = random.randint(1000, 50000)
-        
-        for i in range(num_transactions):
-            date = (datetime.now() - timedelta(days=random.randint(0, 90))).strftime('%Y-%m-%d')
-            descriptions = [
-                f"ATM WITHDRAWAL - {fake.city()}",
-                f"PURCHASE - {fake.company()}",
-                f"TRANSFER TO {fake.name()}",
-                f"DEPOSIT - CHECK #{random.randint(1000, 9999)}"
-            ]
-            amount = random.randint(-5000, 3000)
-            balance += amount
-            account = f"****{random.randint(1000, 9999)}"
-            category = random.choice(['ATM', 'PURCHASE', 'TRANSFER', 'DEPOSIT', 'FEE'])
-            
-            data += f"{date},{random.choice(descriptions)},{amount:.2f},{account},{category},{balance:.2f}\n"
+{_DASH80}
+""")
+        num_transactions = rng.randint(20, 100)
+        balance = rng.randint(1000, 50000)
+        
+        # Draw each column up front; rows are then formatted in a single pass
+        desc_kinds = rng.choices(range(4), k=num_transactions)
+        categories = rng.choices(['ATM', 'PURCHASE', 'TRANSFER', 'DEPOSIT', 'FEE'], k=num_transactions)
+        amounts = [rng.randint(-5000, 3000) for _ in range(num_transactions)]
+        balances = list(accumulate(amounts, initial=balance))[1:]
+        accounts = [rng.randint(1000, 9999) for _ in range(num_transactions)]
+        
+        dates = rng.choices(_recent_dates(90), k=num_transactions)
+        descriptions = [_financial_description(kind, rng) for kind in desc_kinds]
+        
+        rows = zip(dates, descriptions, amounts, accounts, categories, balances)
+        buf.writelines(_FINANCIAL_ROW % row for row in rows)
         
-        self.case.documents.append(data)
+        self.case.documents.append(buf.getvalue())
     
     def _generate_evidence_log_spreadsheet(self):
         """Generate actual evidence log CSV data."""
-        data = f"""--- EVIDENCE LOG (CSV DATA) ---
-File: evidence_log_{random.randint(1, 99):03d}.xlsx
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- EVIDENCE LOG (CSV DATA) ---
+File: evidence_log_{rng.randint(1, 99):03d}.xlsx
 
 Evidence ID,Type,Description,Location Found,Date Collected,Collected By,Status
-{'-' * 100}
-"""
+{_DASH100}
+""")
         evidence_types = ['Physical', 'Digital', 'Document', 'Biological', 'Firearm']
-        locations = [fake.address() for _ in range(5)]
-        officers = [fake.name() for _ in range(3)]
+        if self._evidence_pools_case is not self.case:
+            self._evidence_pools = _make_evidence_pools()
+            self._evidence_pools_case = self.case
+        locations, officers = self._evidence_pools
         statuses = ['In Storage', 'At Lab', 'Returned']
         
-        num_items = min(random.randint(10, 50), len(self.case.evidence) + 5)
-        for i in range(num_items):
-            evid_id = f"EVID-{random.randint(1000, 9999)}"
-            evid_type = random.choice(evidence_types)
-            description = random.choice([
-                "Item recovered from scene",
-                "Evidence collected during search",
-                "Item seized from suspect"
-            ])
-            location = random.choice(locations)
-            date = (datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d')
-            officer = random.choice(officers)
-            status = random.choice(statuses)
-            
-            data += f"{evid_id},{evid_type},{description},{location},{date},{officer},{status}\n"
+        descriptions = [
+            "Item recovered from scene",
+            "Evidence collected during search",
+            "Item seized from suspect"
+        ]
         
-        self.case.documents.append(data)
+        num_items = min(rng.randint(10, 50), len(self.case.evidence) + 5)
+        rows = zip(
+            [rng.randint(1000, 9999) for _ in range(num_items)],
+            rng.choices(evidence_types, k=num_items),
+            rng.choices(descriptions, k=num_items),
+            rng.choices(locations, k=num_items),
+            rng.choices(_recent_dates(30), k=num_items),
+            rng.choices(officers, k=num_items),
+            rng.choices(statuses, k=num_items)
+        )
+        buf.writelines(_EVIDENCE_ROW % row for row in rows)
+        
+        self.case.documents.append(buf.getvalue())
     
     def _generate_phone_records_spreadsheet(self):
         """Generate actual phone call records CSV data."""
-        data = f"""--- PHONE RECORDS (CSV DATA) ---
-File: phone_records_{random.randint(1, 99):03d}.xlsx
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w(f"""--- PHONE RECORDS (CSV DATA) ---
+File: phone_records_{rng.randint(1, 99):03d}.xlsx
 
 Date,Time,Duration,From Number,To Number,Call Type,Location
-{'-' * 100}
-"""
-        num_calls = random.randint(50, 200)
-        for i in range(num_calls):
-            date = (datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d')
-            time = f"{random.randint(0, 23):02d}:{random.randint(0, 59):02d}"
-            duration = random.randint(10, 3600)
-            from_num = f"{random.randint(200, 999)}-{random.randint(200, 999)}-{random.randint(1000, 9999)}"
-            to_num = f"{random.randint(200, 999)}-{random.randint(200, 999)}-{random.randint(1000, 9999)}"
-            call_type = random.choice(['Voice', 'Text', 'Data'])
-            location = f"{fake.city()}, {fake.state_abbr()}"
-            
-            data += f"{date},{time},{duration},{from_num},{to_num},{call_type},{location}\n"
+{_DASH100}
+""")
+        num_calls = rng.randint(50, 200)
+        rows = zip(
+            rng.choices(_recent_dates(30), k=num_calls),
+            [rng.randint(0, 23) for _ in range(num_calls)],
+            [rng.randint(0, 59) for _ in range(num_calls)],
+            [rng.randint(10, 3600) for _ in range(num_calls)],
+            [_random_phone_number(rng) for _ in range(num_calls)],
+            [_random_phone_number(rng) for _ in range(num_calls)],
+            rng.choices(['Voice', 'Text', 'Data'], k=num_calls),
+            [f"{fake.city()}, {fake.state_abbr()}" for _ in range(num_calls)]
+        )
+        buf.writelines(_PHONE_ROW % row for row in rows)
         
-        self.case.documents.append(data)
+        self.case.documents.append(buf.getvalue())
     
     def _generate_ransom_note(self):
         """Generate a ransom note."""
-        phrases = [
-            "We have {victim}. Do not contact police.",
-            "If you want {victim} back alive, follow instructions exactly.",
-            "Place {amount} in unmarked bills.",
-            "Wait for further instructions.",
-            "Tell no one or {victim} dies.",
-            "You have {hours} hours."
-        ]
-        
-        note = "RANSOM NOTE\n"
-        note += "=" * 50 + "\n\n"
-        
-        num_phrases = random.randint(3, 6)
-        selected_phrases = random.sample(phrases, num_phrases)
-        
+        rng = self.rng
+        buf = io.StringIO()
+        w = buf.write
+        w("RANSOM NOTE\n")
+        w(_EQ50 + "\n\n")
+        
+        num_phrases = rng.randint(3, 6)
+        selected_phrases = rng.sample(_RANSOM_PHRASES, num_phrases)
+        
+        # Fields are only generated if a selected phrase references them
+        fields = _LazyFields(
+            victim=lambda: rng.choice(["him", "her", "them", "the package"]),
+            amount=lambda: f"${rng.randint(10000, 500000)}",
+            hours=lambda: rng.randint(24, 72)
+        )
         for phrase in selected_phrases:
-            text = phrase.format(
-                victim=random.choice(["him", "her", "them", "the package"]),
-                amount=f"${random.randint(10000, 500000)}",
-                hours=random.randint(24, 72)
-            )
+            text = phrase.format_map(fields)
             
             # Add handwritten-style variations
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 text = text.upper()
-            elif random.random() < 0.2:
+            elif rng.random() < 0.2:
                 text = text.lower()
             
-            note += text + "\n"
+            w(text + "\n")
         
-        note += "\n" + "=" * 50 + "\n"
-        note += f"[Note recovered: {datetime.now().strftime('%Y-%m-%d')}]\n"
-        note += "[Handwriting analysis pending]\n"
+        w("\n" + _EQ50 + "\n")
+        w(f"[Note recovered: {_now_str()[:10]}]\n")
+        w("[Handwriting analysis pending]\n")
         
-        self.case.documents.append(note)
+        self.case.documents.append(buf.getvalue())
 
     # --- REALISTIC ERROR HANDLING ---
     
@@ -3478,8 +3690,8 @@ Date,Time,Duration,From Number,To Number,Call Type,Location
         if error_msg:
             # Find the severity of the error
             for event in self.error_generator.events_log:
-                if event.get('item') == doc_id and event.get('type') == EventType.DOCUMENT_ERROR:
-                    severity = event.get('severity')
+                if event.item == doc_id and event.type == EventType.DOCUMENT_ERROR:
+                    severity = event.severity
                     document = self.error_generator.apply_error_to_document(document, error_msg, severity)
                     # Add error note to document
                     document = f"[ERROR LOG: {error_msg}]\n\n{document}"
@@ -3505,19 +3717,20 @@ Date,Time,Duration,From Number,To Number,Call Type,Location
             self.case.documents.append(f"\n--- ENVIRONMENTAL EVENT LOG ---\n{env_event}\n")
         
         # Check for evidence mishandling (affects already-generated evidence)
-        for evidence in self.case.evidence:
-            error_msg = self.error_generator.check_evidence_error(
-                evidence.id, evidence.type.value, current_date
-            )
-            if error_msg:
-                # Add error note to evidence description
-                evidence.description += f"\n\n[ERROR LOG: {error_msg}]"
-                # If catastrophic, mark evidence as compromised
-                for event in self.error_generator.events_log:
-                    if (event.get('item') == evidence.id and 
-                        event.get('severity') == ErrorSeverity.CATASTROPHIC):
-                        evidence.description += "\n[CRITICAL: EVIDENCE INTEGRITY COMPROMISED]"
-                        break
+        evidence_by_id = {evidence.id: evidence for evidence in self.case.evidence}
+        hits = self.error_generator.batch_check(
+            EventType.EVIDENCE_MISHANDLING,
+            [evidence.id for evidence in self.case.evidence],
+            current_date,
+            [evidence.type.value for evidence in self.case.evidence]
+        )
+        for evidence_id, severity, error_msg in hits:
+            evidence = evidence_by_id[evidence_id]
+            # Add error note to evidence description
+            evidence.description += f"\n\n[ERROR LOG: {error_msg}]"
+            # If catastrophic, mark evidence as compromised
+            if severity == ErrorSeverity.CATASTROPHIC:
+                evidence.description += "\n[CRITICAL: EVIDENCE INTEGRITY COMPROMISED]"
         
         # Apply errors to existing documents (simulate corruption after generation)
         for i, doc in enumerate(self.case.documents):
@@ -3530,9 +3743,9 @@ Date,Time,Duration,From Number,To Number,Call Type,Location
                     )
                     if error_msg:
                         for event in self.error_generator.events_log:
-                            if (event.get('item') == doc_id and 
-                                event.get('type') == EventType.DOCUMENT_ERROR):
-                                severity = event.get('severity')
+                            if (event.item == doc_id and 
+                                event.type == EventType.DOCUMENT_ERROR):
+                                severity = event.severity
                                 modified_doc = self.error_generator.apply_error_to_document(
                                     doc, error_msg, severity
                                 )
@@ -3906,3 +4119,20 @@ MD5 Hash: {file_hash}
             collected_at=self.case.date_opened,
             location_found="Bank Records"
         ))
+
+
+# --- BATCH WORKERS (module level so they can be pickled by ProcessPoolExecutor) ---
+
+_batch_generator = None
+
+def _init_batch_worker():
+    """Give each worker process its own RNG stream and CaseGenerator."""
+    global _batch_generator
+    seed = os.getpid() ^ time.time_ns()
+    random.seed(seed)
+    fake.reseed(seed)
+    _batch_generator = CaseGenerator(seed=seed)
+
+def _generate_batch_case(spec: Dict) -> Case:
+    """Generate a single case inside a batch worker."""
+    return _batch_generator.generate_case(**spec)
@@ -63,6 +63,7 @@ class Person:
     social_handle: Optional[str] = None  # Social media handle
     reliability_score: int = 50  # Witness reliability (0-100)
     relationships: Dict[str, str] = field(default_factory=dict)  # Relationships to other persons
+    suspicious_activities: List[str] = field(default_factory=list)  # For persons of interest
     
     # Physical description fields
     gender: str = ""  # male, female, other
@@ -97,6 +98,19 @@ class Person:
             parts.append(f"{self.weight} lbs")
         return ", ".join(parts) if parts else "Description not available"
 
+    @property
+    def display_physical(self) -> str:
+        """Physical description for reports, 'Not available' when nothing is known."""
+        description = self.physical_description
+        return description if description != "Description not available" else "Not available"
+
+    @property
+    def display_license(self) -> str:
+        """Driver's license with issuing state for reports, 'Not on file' when absent."""
+        if self.driver_license_number:
+            return f"{self.driver_license_number} ({self.driver_license_state})"
+        return "Not on file"
+
 class EvidenceType(Enum):
     PHYSICAL = "Physical"
     DIGITAL = "Digital"
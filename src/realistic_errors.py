@@ -5,9 +5,14 @@ Simulates human errors, mishandling, and catastrophic events that occur
 during case generation to create more realistic, messy case files.
 """
 
+import math
 import random
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from functools import lru_cache
+from string import Formatter
+from typing import List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from enum import Enum
 
 
@@ -29,6 +34,29 @@ class EventType(Enum):
     CORRUPTION = "Data Corruption"
 
 
+# Severities from most to least likely; the order severities are rolled in
+_SEVERITY_ORDER = (ErrorSeverity.MINOR, ErrorSeverity.MODERATE,
+                   ErrorSeverity.MAJOR, ErrorSeverity.CATASTROPHIC)
+
+# Small-int positions used to index the precomputed probability and template
+# tables; Enum hashing goes through a Python-level __hash__, plain ints don't
+for _idx, _member in enumerate(_SEVERITY_ORDER):
+    _member.idx = _idx
+for _idx, _member in enumerate(EventType):
+    _member.idx = _idx
+
+
+@dataclass
+class EventRecord:
+    """A single error or event logged by RealisticErrorGenerator."""
+    __slots__ = ('type', 'severity', 'item', 'message', 'timestamp')
+    type: EventType
+    severity: ErrorSeverity
+    item: Optional[str]  # Affected document/evidence id; None for case-wide events
+    message: str
+    timestamp: datetime
+
+
 # ========== ERROR PROBABILITY TABLES ==========
 
 # Base probabilities for different event types (per document/evidence item)
@@ -233,22 +261,148 @@ ENVIRONMENTAL_EVENTS = {
 }
 
 
+# Template tuples indexed by [event_type.idx][severity.idx]; events without
+# their own table fall back to the document error templates.
+_TEMPLATE_TABLES = {
+    EventType.DOCUMENT_ERROR: DOCUMENT_ERRORS,
+    EventType.EVIDENCE_MISHANDLING: EVIDENCE_ERRORS,
+    EventType.SYSTEM_FAILURE: SYSTEM_ERRORS,
+    EventType.ENVIRONMENTAL: ENVIRONMENTAL_EVENTS,
+}
+_TEMPLATES: Tuple[Tuple[Tuple[str, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_TEMPLATE_TABLES.get(event_type, DOCUMENT_ERRORS)[severity])
+        for severity in _SEVERITY_ORDER
+    )
+    for event_type in EventType
+)
+
+
 # ========== EVENT TIMING LOGIC ==========
 
+# Upper bounds in seconds (1 hour, 6 hours, 3 days, 28 days) of each time
+# category, in TIME_MODIFIERS order
+_BINS = (3600, 21600, 259200, 2419200)
+_TIME_CATEGORIES = tuple(TIME_MODIFIERS)
+
+
+def _time_category_index(incident_date: datetime, current_date: datetime) -> int:
+    """Index into _TIME_CATEGORIES for the time elapsed since the incident."""
+    return bisect_right(_BINS, (current_date - incident_date).total_seconds())
+
+
 def get_time_category(incident_date: datetime, current_date: datetime) -> str:
     """Determine time category for probability modifier."""
-    delta = current_date - incident_date
-    
-    if delta.total_seconds() < 3600:  # Less than 1 hour
-        return "immediate"
-    elif delta.total_seconds() < 21600:  # Less than 6 hours
-        return "hours_after"
-    elif delta.days < 3:
-        return "days_after"
-    elif delta.days < 28:
-        return "weeks_after"
-    else:
-        return "months_after"
+    return _TIME_CATEGORIES[_time_category_index(incident_date, current_date)]
+
+
+@lru_cache(maxsize=64)
+def _fmt_day(day_ordinal: int) -> str:
+    """'YYYY-MM-DD' for a proleptic Gregorian ordinal; most events share a day."""
+    return date.fromordinal(day_ordinal).strftime('%Y-%m-%d')
+
+
+def _positional_template(template: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Rewrite a {name} template to {0}/{1} form.
+
+    Returns the rewritten template and its field names in argument order, so
+    it can be filled with format(*args) instead of a keyword dict.
+    """
+    parts = []
+    names: List[str] = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if name is None:
+            continue
+        if name not in names:
+            names.append(name)
+        parts.append('{%d%s%s}' % (names.index(name),
+                                   '!' + conversion if conversion else '',
+                                   ':' + spec if spec else ''))
+    return ''.join(parts), tuple(names)
+
+
+# Positional form and field names of each template, parsed once at import
+_TEMPLATE_FIELDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    template: _positional_template(template)
+    for table in _TEMPLATES
+    for templates in table
+    for template in templates
+}
+
+# Fallback values for template fields the caller's context doesn't supply,
+# each drawn from the RNG it is called with
+_DEFAULT_FIELDS = {
+    'date': lambda rng: 'unknown',
+    'actual_date': lambda rng: _fmt_day(date.today().toordinal()),
+    'page': lambda rng: rng.randint(1, 10),
+    'section': lambda rng: 'unknown',
+    'word': lambda rng: 'unknown',
+    'badge': lambda rng: 'unknown',
+    'line': lambda rng: rng.randint(1, 50),
+    'percentage': lambda rng: rng.randint(20, 80),
+    'items': lambda rng: rng.randint(1, 10),
+    'hours': lambda rng: rng.randint(1, 24),
+    'days': lambda rng: rng.randint(1, 7),
+    'event': lambda rng: rng.choice(['accident', 'incident', 'system failure', 'human error']),
+    'evidence_id': lambda rng: f"EVID-{rng.randint(1000, 9999)}",
+    'doc_id': lambda rng: f"DOC-{rng.randint(1000, 9999)}",
+    'other_case': lambda rng: f"CASE-{rng.randint(100000, 999999)}",
+    'location': lambda rng: 'unknown',
+    'count': lambda rng: rng.randint(2, 5),
+    'start': lambda rng: rng.randint(1, 10),
+    'end': lambda rng: rng.randint(11, 20),
+    'correct_date': lambda rng: _fmt_day(date.today().toordinal()),
+    'correct_word': lambda rng: 'unknown',
+    'correct_badge': lambda rng: f"{rng.randint(1000, 9999)}"
+}
+
+
+@lru_cache(maxsize=None)
+def _scaled_probabilities(complexity: str) -> Tuple[Tuple[Tuple[float, ...], ...], ...]:
+    """
+    Fold the time and complexity modifiers into the base probabilities.
+
+    Returns probabilities indexed by [time_idx][event_type.idx][severity.idx],
+    with time_idx following _TIME_CATEGORIES, so a roll is three tuple
+    indexes instead of three dict reads and two multiplies.
+    """
+    complexity_mod = COMPLEXITY_MODIFIERS.get(complexity, 1.0)
+    return tuple(
+        tuple(
+            tuple(
+                EVENT_PROBABILITIES[event_type][severity] * TIME_MODIFIERS[time_cat] * complexity_mod
+                for severity in _SEVERITY_ORDER
+            )
+            for event_type in EventType
+        )
+        for time_cat in _TIME_CATEGORIES
+    )
+
+
+@lru_cache(maxsize=None)
+def _severity_tables(complexity: str) -> Tuple[Tuple[Tuple[float, ...], ...], ...]:
+    """
+    Cumulative first-hit probabilities, indexed by [time_idx][event_type.idx].
+
+    Rolling each severity in turn (minor first) and stopping at the first hit
+    is the same as one roll against p_any = cum[-1] followed by picking the
+    severity from these cumulative weights, so the common no-event case costs
+    a single random draw.
+    """
+    tables = []
+    for scaled in _scaled_probabilities(complexity):
+        table = []
+        for probs in scaled:
+            miss, total, cum = 1.0, 0.0, []
+            for prob in probs:
+                total += miss * prob
+                miss *= 1.0 - prob
+                cum.append(total)
+            table.append(tuple(cum))
+        tables.append(tuple(table))
+    return tuple(tables)
 
 
 def roll_for_event(event_type: EventType, severity: ErrorSeverity, 
@@ -259,80 +413,114 @@ def roll_for_event(event_type: EventType, severity: ErrorSeverity,
     
     Returns True if event occurs, False otherwise.
     """
-    base_prob = EVENT_PROBABILITIES[event_type][severity]
-    time_cat = get_time_category(incident_date, current_date)
-    time_mod = TIME_MODIFIERS.get(time_cat, 1.0)
-    complexity_mod = COMPLEXITY_MODIFIERS.get(complexity, 1.0)
-    
-    final_prob = base_prob * time_mod * complexity_mod
-    
-    return random.random() < final_prob
+    time_idx = _time_category_index(incident_date, current_date)
+    return random.random() < _scaled_probabilities(complexity)[time_idx][event_type.idx][severity.idx]
 
 
 def generate_error_message(event_type: EventType, severity: ErrorSeverity,
-                          context: Dict = None) -> str:
+                          context: Dict = None, rng=random) -> str:
     """Generate a realistic error message based on event type and severity."""
     context = context or {}
     
-    if event_type == EventType.DOCUMENT_ERROR:
-        templates = DOCUMENT_ERRORS[severity]
-    elif event_type == EventType.EVIDENCE_MISHANDLING:
-        templates = EVIDENCE_ERRORS[severity]
-    elif event_type == EventType.SYSTEM_FAILURE:
-        templates = SYSTEM_ERRORS[severity]
-    elif event_type == EventType.ENVIRONMENTAL:
-        templates = ENVIRONMENTAL_EVENTS[severity]
-    else:
-        templates = DOCUMENT_ERRORS[severity]  # Default fallback
+    template = rng.choice(_TEMPLATES[event_type.idx][severity.idx])
+    positional, fields = _TEMPLATE_FIELDS[template]
+    if not fields:
+        # Nothing to substitute
+        return template
     
-    template = random.choice(templates)
+    # Fill in only the variables this template uses (context overrides defaults)
+    args = []
+    for name in fields:
+        if name in context:
+            args.append(context[name])
+        elif name in _DEFAULT_FIELDS:
+            args.append(_DEFAULT_FIELDS[name](rng))
+        else:
+            # No value available, return template with error note
+            return f"{template} [ERROR: Missing variable {name!r}]"
     
-    # Fill in template variables
-    defaults = {
-        'date': 'unknown',
-        'actual_date': datetime.now().strftime('%Y-%m-%d'),
-        'page': random.randint(1, 10),
-        'section': 'unknown',
-        'word': 'unknown',
-        'badge': 'unknown',
-        'line': random.randint(1, 50),
-        'percentage': random.randint(20, 80),
-        'items': random.randint(1, 10),
-        'hours': random.randint(1, 24),
-        'days': random.randint(1, 7),
-        'event': random.choice(['accident', 'incident', 'system failure', 'human error']),
-        'evidence_id': f"EVID-{random.randint(1000, 9999)}",
-        'doc_id': f"DOC-{random.randint(1000, 9999)}",
-        'other_case': f"CASE-{random.randint(100000, 999999)}",
-        'location': 'unknown',
-        'count': random.randint(2, 5),
-        'start': random.randint(1, 10),
-        'end': random.randint(11, 20),
-        'correct_date': datetime.now().strftime('%Y-%m-%d'),
-        'correct_word': 'unknown',
-        'correct_badge': f"{random.randint(1000, 9999)}"
+    return positional.format(*args)
+
+
+# Per-event context values, built as (rng, item_id, item_type, current_date)
+_CONTEXT_BUILDERS = {
+    EventType.DOCUMENT_ERROR: {
+        'doc_id': lambda rng, item_id, item_type, current_date: item_id,
+        'doc_type': lambda rng, item_id, item_type, current_date: item_type,
+        'date': lambda rng, item_id, item_type, current_date: _fmt_day(current_date.toordinal()),
+        'page': lambda rng, *_: rng.randint(1, 20),
+        'section': lambda rng, *_: rng.choice(['Section A', 'Section B', 'Narrative', 'Evidence']),
+        'percentage': lambda rng, *_: rng.randint(20, 80),
+        'event': lambda rng, *_: rng.choice(['accident', 'system crash', 'water damage', 'fire'])
+    },
+    EventType.EVIDENCE_MISHANDLING: {
+        'evidence_id': lambda rng, item_id, item_type, current_date: item_id,
+        'evidence_type': lambda rng, item_id, item_type, current_date: item_type,
+        'date': lambda rng, item_id, item_type, current_date: _fmt_day(current_date.toordinal()),
+        'days': lambda rng, *_: rng.randint(1, 14),
+        'hours': lambda rng, *_: rng.randint(1, 48),
+        'percentage': lambda rng, *_: rng.randint(10, 50),
+        'event': lambda rng, *_: rng.choice(['accident', 'mishandling', 'storage error', 'transfer error']),
+        'location': lambda rng, *_: 'unknown',
+        'count': lambda rng, *_: rng.randint(2, 5)
+    },
+    EventType.SYSTEM_FAILURE: {
+        'hours': lambda rng, *_: rng.randint(1, 72),
+        'days': lambda rng, *_: rng.randint(1, 7),
+        'percentage': lambda rng, *_: rng.randint(10, 90),
+        'items': lambda rng, *_: rng.randint(1, 50)
+    },
+    EventType.ENVIRONMENTAL: {
+        'percentage': lambda rng, *_: rng.randint(20, 80),
+        'items': lambda rng, *_: rng.randint(1, 20),
+        'event': lambda rng, *_: rng.choice(['fire', 'flood', 'water leak', 'power outage'])
     }
-    # Merge defaults with provided context (context overrides defaults)
-    merged_context = {**defaults, **context}
+}
+
+
+class _LazyContext:
+    """Template context that only builds a value when the template asks for it."""
+    __slots__ = ('_builders', '_args')
+    
+    def __init__(self, builders: Dict, *args):
+        self._builders = builders
+        self._args = args
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._builders
     
-    try:
-        return template.format(**merged_context)
-    except KeyError as e:
-        # If still missing keys, return template with error note
-        return f"{template} [ERROR: Missing variable {e}]"
+    def __getitem__(self, name: str):
+        return self._builders[name](*self._args)
+
+
+def _insert_at_line_break(document: str, text: str, rng=random) -> str:
+    """
+    Insert text at the start of a line roughly in the middle of the document.
+
+    Picks a random offset in the middle half and snaps it to the next line
+    break, so the document is copied once rather than split and re-joined.
+    """
+    offset = rng.randint(len(document) // 4, 3 * len(document) // 4)
+    nl = document.find('\n', offset)
+    if nl < 0:
+        nl = document.rfind('\n', 0, offset)
+    return f"{document[:nl + 1]}{text}{document[nl + 1:]}"
 
 
 class RealisticErrorGenerator:
     """Generates realistic errors and events during case generation."""
     
-    def __init__(self, incident_date: datetime, complexity: str = "Medium"):
+    def __init__(self, incident_date: datetime, complexity: str = "Medium",
+                 seed: Optional[int] = None):
         self.incident_date = incident_date
         self.complexity = complexity
-        self.events_log: List[Dict] = []
-        self.affected_items: Dict[str, List[str]] = {
-            'documents': [],
-            'evidence': [],
-            'persons': []
+        self.rng = random.Random(seed)
+        self._severity_cdf = _severity_tables(complexity)
+        self.events_log: List[EventRecord] = []
+        self.affected_items: Dict[str, Set[str]] = {
+            'documents': set(),
+            'evidence': set(),
+            'persons': set()
         }
     
     def check_document_error(self, doc_id: str, doc_type: str, 
@@ -341,32 +529,10 @@ class RealisticErrorGenerator:
         Check if a document error occurs.
         Returns error message if error occurs, None otherwise.
         """
-        # Roll for different severity levels (most likely to least)
-        for severity in [ErrorSeverity.MINOR, ErrorSeverity.MODERATE, 
-                         ErrorSeverity.MAJOR, ErrorSeverity.CATASTROPHIC]:
-            if roll_for_event(EventType.DOCUMENT_ERROR, severity, 
-                            self.incident_date, current_date, self.complexity):
-                context = {
-                    'doc_id': doc_id,
-                    'doc_type': doc_type,
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'page': random.randint(1, 20),
-                    'section': random.choice(['Section A', 'Section B', 'Narrative', 'Evidence']),
-                    'percentage': random.randint(20, 80),
-                    'event': random.choice(['accident', 'system crash', 'water damage', 'fire'])
-                }
-                error_msg = generate_error_message(
-                    EventType.DOCUMENT_ERROR, severity, context
-                )
-                self.events_log.append({
-                    'type': EventType.DOCUMENT_ERROR,
-                    'severity': severity,
-                    'item': doc_id,
-                    'message': error_msg,
-                    'timestamp': current_date
-                })
-                self.affected_items['documents'].append(doc_id)
-                return error_msg
+        severity = self._roll_severity(EventType.DOCUMENT_ERROR, current_date)
+        if severity is not None:
+            return self._log_event(EventType.DOCUMENT_ERROR, severity,
+                                   doc_id, doc_type, current_date)
         return None
     
     def check_evidence_error(self, evidence_id: str, evidence_type: str,
@@ -375,82 +541,107 @@ class RealisticErrorGenerator:
         Check if an evidence mishandling error occurs.
         Returns error message if error occurs, None otherwise.
         """
-        for severity in [ErrorSeverity.MINOR, ErrorSeverity.MODERATE,
-                         ErrorSeverity.MAJOR, ErrorSeverity.CATASTROPHIC]:
-            if roll_for_event(EventType.EVIDENCE_MISHANDLING, severity,
-                            self.incident_date, current_date, self.complexity):
-                context = {
-                    'evidence_id': evidence_id,
-                    'evidence_type': evidence_type,
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'days': random.randint(1, 14),
-                    'hours': random.randint(1, 48),
-                    'percentage': random.randint(10, 50),
-                    'event': random.choice(['accident', 'mishandling', 'storage error', 'transfer error']),
-                    'location': 'unknown',
-                    'count': random.randint(2, 5)
-                }
-                error_msg = generate_error_message(
-                    EventType.EVIDENCE_MISHANDLING, severity, context
-                )
-                self.events_log.append({
-                    'type': EventType.EVIDENCE_MISHANDLING,
-                    'severity': severity,
-                    'item': evidence_id,
-                    'message': error_msg,
-                    'timestamp': current_date
-                })
-                self.affected_items['evidence'].append(evidence_id)
-                return error_msg
+        severity = self._roll_severity(EventType.EVIDENCE_MISHANDLING, current_date)
+        if severity is not None:
+            return self._log_event(EventType.EVIDENCE_MISHANDLING, severity,
+                                   evidence_id, evidence_type, current_date)
         return None
     
     def check_system_error(self, current_date: datetime) -> Optional[str]:
         """Check if a system error occurs."""
-        for severity in [ErrorSeverity.MINOR, ErrorSeverity.MODERATE,
-                         ErrorSeverity.MAJOR, ErrorSeverity.CATASTROPHIC]:
-            if roll_for_event(EventType.SYSTEM_FAILURE, severity,
-                            self.incident_date, current_date, self.complexity):
-                context = {
-                    'hours': random.randint(1, 72),
-                    'days': random.randint(1, 7),
-                    'percentage': random.randint(10, 90),
-                    'items': random.randint(1, 50)
-                }
-                error_msg = generate_error_message(
-                    EventType.SYSTEM_FAILURE, severity, context
-                )
-                self.events_log.append({
-                    'type': EventType.SYSTEM_FAILURE,
-                    'severity': severity,
-                    'message': error_msg,
-                    'timestamp': current_date
-                })
-                return error_msg
+        severity = self._roll_severity(EventType.SYSTEM_FAILURE, current_date)
+        if severity is not None:
+            return self._log_event(EventType.SYSTEM_FAILURE, severity,
+                                   None, None, current_date)
         return None
     
     def check_environmental_event(self, current_date: datetime) -> Optional[str]:
         """Check if an environmental event occurs."""
-        for severity in [ErrorSeverity.MINOR, ErrorSeverity.MODERATE,
-                         ErrorSeverity.MAJOR, ErrorSeverity.CATASTROPHIC]:
-            if roll_for_event(EventType.ENVIRONMENTAL, severity,
-                            self.incident_date, current_date, self.complexity):
-                context = {
-                    'percentage': random.randint(20, 80),
-                    'items': random.randint(1, 20),
-                    'event': random.choice(['fire', 'flood', 'water leak', 'power outage'])
-                }
-                error_msg = generate_error_message(
-                    EventType.ENVIRONMENTAL, severity, context
-                )
-                self.events_log.append({
-                    'type': EventType.ENVIRONMENTAL,
-                    'severity': severity,
-                    'message': error_msg,
-                    'timestamp': current_date
-                })
-                return error_msg
+        severity = self._roll_severity(EventType.ENVIRONMENTAL, current_date)
+        if severity is not None:
+            return self._log_event(EventType.ENVIRONMENTAL, severity,
+                                   None, None, current_date)
         return None
     
+    def batch_check(self, event_type: EventType, item_ids: List[str],
+                    current_dates, item_types: Optional[List[str]] = None
+                    ) -> List[Tuple[str, ErrorSeverity, str]]:
+        """
+        Roll for an event against many items at once.
+
+        `current_dates` is either one datetime shared by every item or a
+        sequence parallel to `item_ids`. Only items that actually hit go
+        through context building and message formatting.
+
+        Returns (item_id, severity, message) for each hit, in item order.
+        """
+        if item_types is None:
+            item_types = [None] * len(item_ids)
+        rand = self.rng.random
+        hits = []
+        
+        if isinstance(current_dates, datetime):
+            # Every item shares one probability, so jump straight from hit to
+            # hit with geometric gaps instead of drawing once per item
+            current_date = current_dates
+            cum = self._severity_cdf[
+                _time_category_index(self.incident_date, current_date)
+            ][event_type.idx]
+            p_any = cum[-1]
+            if p_any <= 0.0:
+                return hits
+            log_miss = math.log1p(-p_any) if p_any < 1.0 else None
+            idx = -1
+            while True:
+                idx += 1
+                if log_miss is not None:
+                    idx += int(math.log(1.0 - rand()) / log_miss)
+                if idx >= len(item_ids):
+                    return hits
+                severity = _SEVERITY_ORDER[bisect_right(cum, rand() * p_any)]
+                message = self._log_event(event_type, severity, item_ids[idx],
+                                          item_types[idx], current_date)
+                hits.append((item_ids[idx], severity, message))
+        
+        for item_id, item_type, current_date in zip(item_ids, item_types, current_dates):
+            cum = self._severity_cdf[
+                _time_category_index(self.incident_date, current_date)
+            ][event_type.idx]
+            p_any = cum[-1]
+            if rand() < p_any:
+                severity = _SEVERITY_ORDER[bisect_right(cum, rand() * p_any)]
+                message = self._log_event(event_type, severity, item_id,
+                                          item_type, current_date)
+                hits.append((item_id, severity, message))
+        return hits
+    
+    def _log_event(self, event_type: EventType, severity: ErrorSeverity,
+                   item_id: Optional[str], item_type: Optional[str],
+                   current_date: datetime) -> str:
+        """Format the message for a fired event and record it."""
+        # Context values are only drawn for the fields the chosen template uses
+        context = _LazyContext(_CONTEXT_BUILDERS.get(event_type, {}),
+                               self.rng, item_id, item_type, current_date)
+        error_msg = generate_error_message(event_type, severity, context, self.rng)
+        if item_id is not None:
+            if event_type == EventType.DOCUMENT_ERROR:
+                self.affected_items['documents'].add(item_id)
+            elif event_type == EventType.EVIDENCE_MISHANDLING:
+                self.affected_items['evidence'].add(item_id)
+        self.events_log.append(
+            EventRecord(event_type, severity, item_id, error_msg, current_date)
+        )
+        return error_msg
+    
+    def _roll_severity(self, event_type: EventType,
+                       current_date: datetime) -> Optional[ErrorSeverity]:
+        """Roll for an event; returns the severity that fired, or None."""
+        cum = self._severity_cdf[_time_category_index(self.incident_date, current_date)][event_type.idx]
+        p_any = cum[-1]
+        if self.rng.random() >= p_any:
+            return None
+        return _SEVERITY_ORDER[bisect_right(cum, self.rng.random() * p_any)]
+    
     def apply_error_to_document(self, document: str, error_msg: str, 
                                 severity: ErrorSeverity) -> str:
         """
@@ -459,34 +650,29 @@ class RealisticErrorGenerator:
         """
         if severity == ErrorSeverity.MINOR:
             # Add typos, formatting issues
-            lines = document.split('\n')
-            if lines and random.random() < 0.3:
-                # Add a typo
-                line_idx = random.randint(0, min(10, len(lines) - 1))
-                lines[line_idx] = lines[line_idx].replace('the', 'teh', 1)
-            return '\n'.join(lines)
+            if self.rng.random() < 0.3:
+                return self._add_typo(document)
+            return document
         
         elif severity == ErrorSeverity.MODERATE:
-            # Remove sections, add corruption markers
-            lines = document.split('\n')
-            if len(lines) > 20:
-                # Remove random section
-                start = random.randint(5, len(lines) - 10)
-                end = start + random.randint(3, 8)
-                lines.insert(start, f"\n[NOTE: {error_msg}]\n")
-                lines.insert(start + 1, "[SECTION PARTIALLY ILLEGIBLE]")
-            return '\n'.join(lines)
+            # Add corruption markers partway through
+            if document.count('\n') >= 20:
+                return _insert_at_line_break(
+                    document,
+                    f"\n[NOTE: {error_msg}]\n\n[SECTION PARTIALLY ILLEGIBLE]\n",
+                    self.rng
+                )
+            return document
         
         elif severity == ErrorSeverity.MAJOR:
-            # Significant corruption
-            lines = document.split('\n')
-            if len(lines) > 10:
-                # Mark large sections as corrupted
-                start = random.randint(2, len(lines) - 5)
-                end = min(start + len(lines) // 3, len(lines))
-                lines.insert(start, f"\n[CRITICAL ERROR: {error_msg}]\n")
-                lines.insert(start + 1, "[APPROXIMATELY 50% OF FOLLOWING SECTION ILLEGIBLE]")
-            return '\n'.join(lines)
+            # Mark a large section as corrupted
+            if document.count('\n') >= 10:
+                return _insert_at_line_break(
+                    document,
+                    f"\n[CRITICAL ERROR: {error_msg}]\n\n[APPROXIMATELY 50% OF FOLLOWING SECTION ILLEGIBLE]\n",
+                    self.rng
+                )
+            return document
         
         elif severity == ErrorSeverity.CATASTROPHIC:
             # Document mostly lost
@@ -494,16 +680,36 @@ class RealisticErrorGenerator:
         
         return document
     
+    def _add_typo(self, document: str) -> str:
+        """Swap 'the' for 'teh' in one of the first 11 lines, if it has one."""
+        starts = [0]
+        while len(starts) < 11:
+            nl = document.find('\n', starts[-1])
+            if nl < 0:
+                break
+            starts.append(nl + 1)
+        start = starts[self.rng.randint(0, len(starts) - 1)]
+        end = document.find('\n', start)
+        pos = document.find('the', start, len(document) if end < 0 else end)
+        if pos < 0:
+            return document
+        return f"{document[:pos]}teh{document[pos + 3:]}"
+    
+    def affected_items_sorted(self) -> Dict[str, List[str]]:
+        """Affected item ids per category, sorted for stable output."""
+        return {kind: sorted(ids) for kind, ids in self.affected_items.items()}
+    
     def get_events_summary(self) -> str:
         """Generate a summary of all events that occurred."""
         if not self.events_log:
             return ""
         
-        summary = "\n=== REALISTIC ERRORS AND EVENTS LOG ===\n\n"
+        parts = ["\n=== REALISTIC ERRORS AND EVENTS LOG ===\n\n"]
         for event in self.events_log:
-            summary += f"[{event['timestamp'].strftime('%Y-%m-%d %H:%M')}] "
-            summary += f"{event['severity'].value} {event['type'].value}: "
-            summary += f"{event['message']}\n"
+            parts.append(
+                f"[{event.timestamp:%Y-%m-%d %H:%M}] "
+                f"{event.severity.value} {event.type.value}: {event.message}\n"
+            )
         
-        return summary
+        return "".join(parts)
 
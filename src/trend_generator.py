@@ -4,12 +4,19 @@ Trend Generator - Creates multiple related cases with shared entities and relati
 from datetime import datetime, timedelta
 import random
 import hashlib
+import io
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from functools import lru_cache
+from itertools import cycle
 import string
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, NamedTuple, Optional, Tuple, TextIO
 
 from .models import Case, Person, Role, Vehicle, DigitalDevice
 from .generators import CaseGenerator
-from .utils import generate_person, generate_vehicle, generate_device, geo_mgr, fake
+from .utils import generate_person, generate_vehicle, generate_device, geo_mgr, fake, _faker_pool
 
 
 def generate_trend_id(suspect_name: str, event_date: datetime) -> str:
@@ -44,78 +51,295 @@ def generate_trend_id(suspect_name: str, event_date: datetime) -> str:
     return f"TREND-{alphanumeric}"
 
 
+# Person fields merged across cases in the master file: scalars are filled in
+# when empty, lists are unioned
+_MERGEABLE_ATTRS = ('height', 'hair_color', 'eye_color', 'facial_hair', 'build',
+                    'gender', 'email', 'address', 'phone_number')
+_MERGEABLE_LISTS = ('aliases', 'vehicles', 'devices', 'criminal_history')
+# Hashable stand-in for a list item: strings are their own key, Vehicle and
+# DigitalDevice compare by field values so their field tuple is the key
+_ITEM_KEY = {
+    'aliases': None,
+    'vehicles': attrgetter(*(f.name for f in fields(Vehicle))),
+    'devices': attrgetter(*(f.name for f in fields(DigitalDevice))),
+    'criminal_history': None,
+}
+
+
+def _sample_crime_dates(start_date: datetime, num_cases: int,
+                        spacing_days: Tuple[int, int]) -> List[datetime]:
+    """Crime dates for a trend: case i falls i * (random spacing) days after start_date."""
+    spacings = random.choices(range(spacing_days[0], spacing_days[1] + 1), k=num_cases)
+    return [start_date + timedelta(days=i * spacing) for i, spacing in enumerate(spacings)]
+
+
+# Note appended to every linked case after the first in an Identified trend
+_INVEST_NOTE_TPL = """
+--- INVESTIGATION NOTE ---
+Case #{n} in suspected linked series.
+Investigating potential connections to previous cases.
+Pattern analysis ongoing.
+"""
+
+# Master-file entry layouts, filled per entry with str.format
+_SUSPECT_ENTRY_TPL = """
+- {p.full_name} (Age: {p.age}, DOB: {dob})
+  Gender: {gender}
+  Phone: {p.phone_number}
+  Email: {email}
+  Address: {p.address}
+  Physical Description: {p.display_physical}
+  Driver's License: {p.display_license}
+  Appears in Cases: {cases}
+  Vehicles: {vehicles}
+  Devices: {devices}
+"""
+_VICTIM_ENTRY_TPL = """
+- {p.full_name}
+  Phone: {p.phone_number}
+  Appears in Cases: {cases}
+"""
+_VEHICLE_ENTRY_TPL = """
+- {v.color} {v.make} {v.model} ({v.year})
+  License Plate: {v.license_plate}
+  VIN: {v.vin}
+  Appears in Cases: {cases}
+"""
+_DEVICE_ENTRY_TPL = """
+- {d.type} - {d.make}
+  Phone: {phone}
+  IMEI: {imei}
+  IP: {ip}
+  Appears in Cases: {cases}
+"""
+_RELATIONSHIP_ENTRY_TPL = """
+- {case1} <-> {case2}
+  Connection: {connection_type}
+  Details: {details}
+"""
+
+
+@lru_cache(maxsize=1024)
+def _format_case_ids(case_ids: Tuple[str, ...]) -> str:
+    """Comma-separated case ids; a shared vehicle and its driver often list the same cases."""
+    return ', '.join(case_ids)
+
+
+def _pick_indices(idx: List[int], k: int) -> List[int]:
+    """
+    Uniform random k-subset of idx via a partial Fisher-Yates shuffle.
+    idx is reordered in place so it can be reused as scratch across calls.
+    """
+    n = len(idx)
+    for j in range(k):
+        r = random.randrange(j, n)
+        idx[j], idx[r] = idx[r], idx[j]
+    return idx[:k]
+
+
+def _sample_case_members(pool: List, num_cases: int, min_k: int, max_k: int) -> List[List]:
+    """Members for every case of a trend: case i gets a random min_k..max_k subset of pool."""
+    idx = list(range(len(pool)))
+    ks = random.choices(range(min_k, max_k + 1), k=num_cases)
+    return [[pool[j] for j in _pick_indices(idx, k)] for k in ks]
+
+
+class _EntityColumns:
+    """
+    Shared entities of one kind stored column-wise: the objects, a parallel
+    list of the case ids each appears in, and a key -> row index.
+    """
+    __slots__ = ('objects', 'case_ids', 'keys', 'index')
+    
+    def __init__(self):
+        self.objects = []
+        self.case_ids: List[List[str]] = []
+        self.keys: List[str] = []
+        self.index: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.objects)
+    
+    def add(self, key: str, obj, case_ids: List[str]):
+        """Append a row; the key indexes the newest row for that key."""
+        self.index[key] = len(self.objects)
+        self.objects.append(obj)
+        self.case_ids.append(case_ids)
+        self.keys.append(key)
+    
+    def accumulate(self, key: str, obj, case_id: str):
+        """Record a case for the row under key, adding the row on first sight."""
+        row = self.index.get(key)
+        if row is None:
+            self.add(key, obj, [case_id])
+        else:
+            self.case_ids[row].append(case_id)
+
+
+class SharedPerson(NamedTuple):
+    """A suspect or victim shared across cases."""
+    person: Person
+    case_ids: List[str]
+    person_id: str
+
+
+class SharedVehicle(NamedTuple):
+    """A vehicle shared across cases."""
+    vehicle: Vehicle
+    case_ids: List[str]
+    vin: str
+
+
+class SharedDevice(NamedTuple):
+    """A device shared across cases."""
+    device: DigitalDevice
+    case_ids: List[str]
+    key: str  # IMEI, or MAC address for devices without one
+    imei: Optional[str]
+    phone_number: Optional[str]
+    ip_address: Optional[str]
+
+
 class TrendRegistry:
     """Manages shared entities and relationships across multiple cases in a trend."""
     
     def __init__(self, trend_id: str):
         self.trend_id = trend_id
-        self.shared_entities = {
-            'suspects': [],
-            'victims': [],
+        # Indexed shared entities, stored column-wise
+        self.suspects = _EntityColumns()  # keyed by person id
+        self.victims = _EntityColumns()  # keyed by person id
+        self.vehicles = _EntityColumns()  # keyed by VIN
+        self.devices = _EntityColumns()  # keyed by IMEI, else MAC address
+        # Other shared entities, as lists of entry dicts
+        self.entity_lists: Dict[str, List[Dict]] = {
             'witnesses': [],
-            'vehicles': [],
-            'devices': [],
             'phone_numbers': [],
             'ip_addresses': [],
             'email_addresses': [],
             'bank_accounts': [],
             'locations': []
         }
-        self.case_relationships = []
+        self._case_links = []
+        # group_id -> member case ids; every pair within a group is related
+        self.case_groups: Dict[str, List[str]] = {}
+        self._group_connections: Dict[str, Tuple[str, str]] = {}
         self.timeline = []
+        self._timeline_keys = []  # crime_date of each timeline entry, kept sorted
         self.trend_type = None
+        # Faker-generated master-file details, drawn once so rebuilds match
+        self.dob_by_person: Dict[str, str] = {}  # person id -> 'YYYY-MM-DD'
+        self.investigating_agency: Optional[str] = None
+        self.assigned_detectives: Optional[str] = None
+    
+    def get_shared_entities(self) -> Dict[str, List]:
+        """
+        Snapshot of all shared entities as {kind: [entry, ...]}.
+        Suspects, victims, vehicles and devices are built from the registry
+        columns on each call, so edits to the returned lists are not kept;
+        use the accumulate_*/add_shared_* methods to change the registry.
+        """
+        entities = {
+            'suspects': [
+                SharedPerson(person, case_ids, key)
+                for person, case_ids, key in zip(self.suspects.objects, self.suspects.case_ids, self.suspects.keys)
+            ],
+            'victims': [
+                SharedPerson(person, case_ids, key)
+                for person, case_ids, key in zip(self.victims.objects, self.victims.case_ids, self.victims.keys)
+            ],
+            'vehicles': [
+                SharedVehicle(vehicle, case_ids, key)
+                for vehicle, case_ids, key in zip(self.vehicles.objects, self.vehicles.case_ids, self.vehicles.keys)
+            ],
+            'devices': [
+                SharedDevice(device, case_ids, key, device.imei, device.phone_number, device.ip_address)
+                for device, case_ids, key in zip(self.devices.objects, self.devices.case_ids, self.devices.keys)
+            ]
+        }
+        entities.update(self.entity_lists)
+        return entities
         
-    def add_shared_suspect(self, person: Person, case_ids: List[str]):
-        """Add a suspect that appears in multiple cases."""
-        self.shared_entities['suspects'].append({
-            'person': person,
-            'case_ids': case_ids,
-            'person_id': person.id
-        })
+    def accumulate_suspect(self, person: Person, case_id: str):
+        """Record a case for a shared suspect, adding the suspect on first sight."""
+        self.suspects.accumulate(person.id, person, case_id)
     
-    def add_shared_victim(self, person: Person, case_ids: List[str]):
-        """Add a victim that appears in multiple cases."""
-        self.shared_entities['victims'].append({
-            'person': person,
-            'case_ids': case_ids,
-            'person_id': person.id
-        })
+    def accumulate_victim(self, person: Person, case_id: str):
+        """Record a case for a shared victim, adding the victim on first sight."""
+        self.victims.accumulate(person.id, person, case_id)
     
-    def add_shared_vehicle(self, vehicle: Vehicle, case_ids: List[str]):
-        """Add a vehicle that appears in multiple cases."""
-        self.shared_entities['vehicles'].append({
-            'vehicle': vehicle,
-            'case_ids': case_ids,
-            'vin': vehicle.vin
-        })
+    def add_shared_vehicle(self, vehicle: Vehicle, case_id: str):
+        """Add a vehicle that appears in multiple cases, or record another case for it."""
+        self.vehicles.accumulate(vehicle.vin, vehicle, case_id)
     
-    def add_shared_device(self, device: DigitalDevice, case_ids: List[str]):
-        """Add a device that appears in multiple cases."""
-        self.shared_entities['devices'].append({
-            'device': device,
-            'case_ids': case_ids,
-            'imei': device.imei,
-            'phone_number': device.phone_number,
-            'ip_address': device.ip_address
-        })
+    def add_shared_device(self, device: DigitalDevice, case_id: str):
+        """Add a device that appears in multiple cases, or record another case for it."""
+        # Only phones carry an IMEI; every device has a MAC address
+        self.devices.accumulate(device.imei or device.mac_address, device, case_id)
     
     def link_cases(self, case1_id: str, case2_id: str, connection_type: str, details: str = ""):
-        """Link two cases with a relationship."""
-        self.case_relationships.append({
+        """
+        Link two cases with a relationship.
+        Callers linking many pairs should pass the same details string each
+        time; connection types are interned so links share one copy.
+        """
+        self._case_links.append({
             'case1': case1_id,
             'case2': case2_id,
-            'connection_type': connection_type,
+            'connection_type': sys.intern(connection_type),
             'details': details
         })
     
+    def add_case_to_group(self, case_id: str, group_id: str,
+                          connection_type: str = "", details: str = ""):
+        """
+        Add a case to a group whose cases are all related to each other.
+        The group's connection type and details are taken from its first call.
+        """
+        if group_id not in self.case_groups:
+            self.case_groups[group_id] = []
+            self._group_connections[group_id] = (connection_type, details)
+        self.case_groups[group_id].append(case_id)
+    
+    def iter_case_relationships(self) -> Iterator[Dict]:
+        """Pairwise case links, with case groups expanded into pairs as they are yielded."""
+        yield from self._case_links
+        for group_id, members in self.case_groups.items():
+            connection_type, details = self._group_connections[group_id]
+            for i, case_id in enumerate(members):
+                for prev_id in members[:i]:
+                    yield {
+                        'case1': prev_id,
+                        'case2': case_id,
+                        'connection_type': connection_type,
+                        'details': details
+                    }
+    
+    def count_case_relationships(self) -> int:
+        """Number of pairs iter_case_relationships() yields, without expanding the groups."""
+        return len(self._case_links) + sum(
+            len(members) * (len(members) - 1) // 2 for members in self.case_groups.values()
+        )
+    
     def add_to_timeline(self, case_id: str, crime_date: datetime, crime_type: str):
         """Add a case to the chronological timeline."""
-        self.timeline.append({
+        # Insert in date order; equal dates keep insertion order
+        idx = bisect_right(self._timeline_keys, crime_date)
+        self._timeline_keys.insert(idx, crime_date)
+        self.timeline.insert(idx, {
             'case_id': case_id,
             'crime_date': crime_date,
+            'crime_date_str': crime_date.strftime('%Y-%m-%d %H:%M'),
             'crime_type': crime_type
         })
-        self.timeline.sort(key=lambda x: x['crime_date'])
+
+
+@dataclass(frozen=True)
+class TrendConfig:
+    """Crime types and date ranges for one trend type."""
+    __slots__ = ('crime_types', 'time_span_days', 'case_spacing_days')
+    crime_types: Tuple[str, ...]
+    time_span_days: Tuple[int, int]  # how far back the first case may fall
+    case_spacing_days: Tuple[int, int]  # days between consecutive cases
 
 
 class TrendGenerator:
@@ -123,37 +347,41 @@ class TrendGenerator:
     
     # Trend type configuration
     TREND_TYPES = {
-        "Serial Offender": {
-            "crime_types": ["Burglary", "Robbery", "Assault", "Burglary", "Robbery", "Assault", "Homicide"],
-            "time_span_days": (180, 365),
-            "case_spacing_days": (14, 42)
-        },
-        "Organized Crime": {
-            "crime_types": ["Fraud", "Robbery", "Drug Possession", "Fraud", "Robbery"],
-            "time_span_days": (90, 180),
-            "case_spacing_days": (7, 21)
-        },
-        "Crime Ring": {
-            "crime_types": ["Fraud", "Theft", "Drug Possession", "Robbery", "Burglary", "Fraud", "Assault"],
-            "time_span_days": (120, 240),
-            "case_spacing_days": (10, 30)
-        },
-        "Victim Pattern": {
-            "crime_types": ["Stalking", "Fraud", "Theft", "Burglary", "Assault"],
-            "time_span_days": (90, 180),
-            "case_spacing_days": (14, 35)
-        },
-        "Location Pattern": {
-            "crime_types": ["Burglary", "Vandalism", "Theft", "Burglary", "Assault"],
-            "time_span_days": (60, 120),
-            "case_spacing_days": (7, 21)
-        }
+        "Serial Offender": TrendConfig(
+            crime_types=("Burglary", "Robbery", "Assault", "Burglary", "Robbery", "Assault", "Homicide"),
+            time_span_days=(180, 365),
+            case_spacing_days=(14, 42)
+        ),
+        "Organized Crime": TrendConfig(
+            crime_types=("Fraud", "Robbery", "Drug Possession", "Fraud", "Robbery"),
+            time_span_days=(90, 180),
+            case_spacing_days=(7, 21)
+        ),
+        "Crime Ring": TrendConfig(
+            crime_types=("Fraud", "Theft", "Drug Possession", "Robbery", "Burglary", "Fraud", "Assault"),
+            time_span_days=(120, 240),
+            case_spacing_days=(10, 30)
+        ),
+        "Victim Pattern": TrendConfig(
+            crime_types=("Stalking", "Fraud", "Theft", "Burglary", "Assault"),
+            time_span_days=(90, 180),
+            case_spacing_days=(14, 35)
+        ),
+        "Location Pattern": TrendConfig(
+            crime_types=("Burglary", "Vandalism", "Theft", "Burglary", "Assault"),
+            time_span_days=(60, 120),
+            case_spacing_days=(7, 21)
+        )
     }
     
     def __init__(self):
         self.trend_registry = None
         self.case_generator = CaseGenerator()
         self.identification_status = "Identified"
+        self._now = datetime.now()
+        # Vehicles and phones pre-generated for the current trend's equipped suspects
+        self._vehicle_pool: List[Vehicle] = []
+        self._device_pool: List[DigitalDevice] = []
         
     def generate_trend(
         self,
@@ -164,7 +392,8 @@ class TrendGenerator:
         subject_status: str = "Known",
         subject_clarity: str = None,
         identification_status: str = "Identified",
-        crime_types: List[str] = None
+        crime_types: List[str] = None,
+        with_master: bool = True
     ) -> Tuple[List[Case], TrendRegistry]:
         """
         Generate a trend of related cases.
@@ -175,13 +404,21 @@ class TrendGenerator:
             base_complexity: Complexity level for cases
             base_modifiers: List of modifiers to apply
             subject_status: Known/Unknown/Partially Known
+            subject_clarity: Passed through to each case's suspect generation
             identification_status: Identified (known links) or Unidentified (hidden links)
+            with_master: Append the master investigation file for Identified trends
+                (False skips the cross-case aggregation when it isn't needed)
         """
         # Create registry with temporary ID first (needed during case generation)
         temp_id = f"TREND-TEMP-{random.randint(100000, 999999)}"
         self.trend_registry = TrendRegistry(temp_id)
         self.trend_registry.trend_type = trend_type
         self.identification_status = identification_status
+        # One clock reading anchors every date in this trend
+        self._now = datetime.now()
+        # Equipment pools belong to a single trend
+        self._vehicle_pool = []
+        self._device_pool = []
         
         # Generate cases (registry is now available for trend generation methods)
         trend_generators = {
@@ -201,7 +438,7 @@ class TrendGenerator:
             first_case = cases[0]
             # Get suspect name (or "UNKNOWN" if no suspect)
             suspect_name = "UNKNOWN"
-            event_date = datetime.now()
+            event_date = self._now
             
             # Find suspect in first case
             for person in first_case.persons:
@@ -218,13 +455,13 @@ class TrendGenerator:
             trend_id = generate_trend_id(suspect_name, event_date)
         else:
             # Fallback if no cases generated
-            trend_id = generate_trend_id("UNKNOWN", datetime.now())
+            trend_id = generate_trend_id("UNKNOWN", self._now)
         
         # Update registry with proper ID
         self.trend_registry.trend_id = trend_id
         
         # Generate master investigation file (only for Identified trends)
-        if identification_status == "Identified":
+        if with_master and identification_status == "Identified":
             master_case = self._generate_master_investigation_file(cases)
             cases.append(master_case)
         
@@ -244,15 +481,15 @@ class TrendGenerator:
         """Generate cases with same suspect committing multiple crimes."""
         serial_suspect = self._create_equipped_suspect(min_age=25, max_age=45)
         config = self.TREND_TYPES["Serial Offender"]
-        start_date = datetime.now() - timedelta(days=random.randint(*config["time_span_days"]))
+        start_date = self._now - timedelta(days=random.randint(*config.time_span_days))
         
         # Use provided crime types or fall back to config defaults
-        available_crime_types = crime_types if crime_types else config["crime_types"]
+        available_crime_types = crime_types if crime_types else config.crime_types
         
         cases = []
-        for i in range(num_cases):
-            crime_type = available_crime_types[i % len(available_crime_types)]
-            crime_date = start_date + timedelta(days=i * random.randint(*config["case_spacing_days"]))
+        link_details = f"Suspect {serial_suspect.full_name} appears in both cases"
+        crime_dates = _sample_crime_dates(start_date, num_cases, config.case_spacing_days)
+        for i, (crime_date, crime_type) in enumerate(zip(crime_dates, cycle(available_crime_types))):
             
             case = self._generate_related_case(
                 crime_type=crime_type,
@@ -267,19 +504,13 @@ class TrendGenerator:
             
             cases.append(case)
             # Add suspect to registry (accumulate case IDs)
-            existing_entry = next((e for e in self.trend_registry.shared_entities['suspects'] 
-                                 if e['person_id'] == serial_suspect.id), None)
-            if existing_entry:
-                existing_entry['case_ids'].append(case.id)
-            else:
-                self.trend_registry.add_shared_suspect(serial_suspect, [case.id])
+            self.trend_registry.accumulate_suspect(serial_suspect, case.id)
             self.trend_registry.add_to_timeline(case.id, crime_date, crime_type)
             
             # Link cases if Identified
             if i > 0 and self.identification_status == "Identified":
                 self.trend_registry.link_cases(
-                    cases[i-1].id, case.id, "Same Suspect",
-                    f"Suspect {serial_suspect.full_name} appears in both cases"
+                    cases[i-1].id, case.id, "Same Suspect", link_details
                 )
         
         return cases
@@ -295,21 +526,22 @@ class TrendGenerator:
     ) -> List[Case]:
         """Generate cases with multiple suspects working together."""
         num_members = random.randint(3, 5)
+        self._fill_equipment_pools(num_members)
         organization = [self._create_equipped_suspect(min_age=28, max_age=50) for _ in range(num_members)]
         shared_vehicle = generate_vehicle(organization[0].id, organization[0].address)
         shared_phone = generate_device(organization[0].id, "Phone")
         
         config = self.TREND_TYPES["Organized Crime"]
-        start_date = datetime.now() - timedelta(days=random.randint(*config["time_span_days"]))
+        start_date = self._now - timedelta(days=random.randint(*config.time_span_days))
         
         # Use provided crime types or fall back to config defaults
-        available_crime_types = crime_types if crime_types else config["crime_types"]
+        available_crime_types = crime_types if crime_types else config.crime_types
         
         cases = []
-        for i in range(num_cases):
-            crime_type = available_crime_types[i % len(available_crime_types)]
-            crime_date = start_date + timedelta(days=i * random.randint(*config["case_spacing_days"]))
-            case_members = random.sample(organization, k=random.randint(2, min(3, len(organization))))
+        crime_dates = _sample_crime_dates(start_date, num_cases, config.case_spacing_days)
+        members_per_case = _sample_case_members(organization, num_cases, 2, min(3, len(organization)))
+        for i, (crime_date, crime_type, case_members) in enumerate(
+                zip(crime_dates, cycle(available_crime_types), members_per_case)):
 
             case = self._generate_related_case(
                 crime_type=crime_type,
@@ -326,21 +558,20 @@ class TrendGenerator:
             
             cases.append(case)
             for member in case_members:
-                self.trend_registry.add_shared_suspect(member, [case.id])
+                self.trend_registry.accumulate_suspect(member, case.id)
             if shared_vehicle:
-                self.trend_registry.add_shared_vehicle(shared_vehicle, [case.id])
+                self.trend_registry.add_shared_vehicle(shared_vehicle, case.id)
             if shared_phone:
-                self.trend_registry.add_shared_device(shared_phone, [case.id])
+                self.trend_registry.add_shared_device(shared_phone, case.id)
             
             self.trend_registry.add_to_timeline(case.id, crime_date, crime_type)
             
-            # Link cases if Identified
-            if i > 0 and self.identification_status == "Identified":
-                for prev_case in cases[:i]:
-                    self.trend_registry.link_cases(
-                        prev_case.id, case.id, "Shared Suspects",
-                        "Multiple organization members appear in both cases"
-                    )
+            # Link cases if Identified (every pair of cases in the organization)
+            if self.identification_status == "Identified":
+                self.trend_registry.add_case_to_group(
+                    case.id, "organization", "Shared Suspects",
+                    "Multiple organization members appear in both cases"
+                )
         
         return cases
     
@@ -355,22 +586,22 @@ class TrendGenerator:
     ) -> List[Case]:
         """Generate cases with network of suspects, various crime types."""
         num_members = random.randint(5, 8)
+        self._fill_equipment_pools(num_members)
         ring_members = [self._create_equipped_suspect(min_age=22, max_age=55) for _ in range(num_members)]
-        shared_accounts = [fake.iban() for _ in range(random.randint(2, 4))]
+        shared_accounts = random.sample(_faker_pool('iban'), k=random.randint(2, 4))
         shared_phones = [generate_device(ring_members[0].id, "Phone") for _ in range(random.randint(2, 3))]
         
         config = self.TREND_TYPES["Crime Ring"]
-        start_date = datetime.now() - timedelta(days=random.randint(*config["time_span_days"]))
+        start_date = self._now - timedelta(days=random.randint(*config.time_span_days))
         
         # Use provided crime types or fall back to config defaults
-        available_crime_types = crime_types if crime_types else config["crime_types"]
+        available_crime_types = crime_types if crime_types else config.crime_types
         
         cases = []
-        for i in range(num_cases):
-            crime_type = available_crime_types[i % len(available_crime_types)]
-            crime_date = start_date + timedelta(days=i * random.randint(*config["case_spacing_days"]))
-            case_members = random.sample(ring_members, k=random.randint(1, 3))
-            
+        crime_dates = _sample_crime_dates(start_date, num_cases, config.case_spacing_days)
+        members_per_case = _sample_case_members(ring_members, num_cases, 1, 3)
+        for i, (crime_date, crime_type, case_members) in enumerate(
+                zip(crime_dates, cycle(available_crime_types), members_per_case)):
             shared_account = random.choice(shared_accounts) if random.random() < 0.4 else None
             shared_devices = random.sample(shared_phones, k=random.randint(1, 2)) if random.random() < 0.5 else []
 
@@ -389,9 +620,9 @@ class TrendGenerator:
             
             cases.append(case)
             for member in case_members:
-                self.trend_registry.add_shared_suspect(member, [case.id])
+                self.trend_registry.accumulate_suspect(member, case.id)
             for device in shared_devices:
-                self.trend_registry.add_shared_device(device, [case.id])
+                self.trend_registry.add_shared_device(device, case.id)
             
             self.trend_registry.add_to_timeline(case.id, crime_date, crime_type)
         
@@ -410,18 +641,18 @@ class TrendGenerator:
         repeat_victim = generate_person(Role.VICTIM, min_age=30, max_age=70)
         repeat_victim.devices = [generate_device(repeat_victim.id, "Phone")]
         if not repeat_victim.email:
-            repeat_victim.email = f"{repeat_victim.first_name.lower()}.{repeat_victim.last_name.lower()}@{fake.domain_name()}"
+            repeat_victim.email = f"{repeat_victim.first_name.lower()}.{repeat_victim.last_name.lower()}@{random.choice(_faker_pool('domain_name'))}"
         
         config = self.TREND_TYPES["Victim Pattern"]
-        start_date = datetime.now() - timedelta(days=random.randint(*config["time_span_days"]))
+        start_date = self._now - timedelta(days=random.randint(*config.time_span_days))
         
         # Use provided crime types or fall back to config defaults
-        available_crime_types = crime_types if crime_types else config["crime_types"]
+        available_crime_types = crime_types if crime_types else config.crime_types
         
         cases = []
-        for i in range(num_cases):
-            crime_type = available_crime_types[i % len(available_crime_types)]
-            crime_date = start_date + timedelta(days=i * random.randint(*config["case_spacing_days"]))
+        link_details = f"Victim {repeat_victim.full_name} targeted in both cases"
+        crime_dates = _sample_crime_dates(start_date, num_cases, config.case_spacing_days)
+        for i, (crime_date, crime_type) in enumerate(zip(crime_dates, cycle(available_crime_types))):
             
             case = self._generate_related_case(
                 crime_type=crime_type,
@@ -436,19 +667,13 @@ class TrendGenerator:
             
             cases.append(case)
             # Accumulate case IDs for shared victim
-            existing_entry = next((e for e in self.trend_registry.shared_entities['victims'] 
-                                 if e['person_id'] == repeat_victim.id), None)
-            if existing_entry:
-                existing_entry['case_ids'].append(case.id)
-            else:
-                self.trend_registry.add_shared_victim(repeat_victim, [case.id])
+            self.trend_registry.accumulate_victim(repeat_victim, case.id)
             self.trend_registry.add_to_timeline(case.id, crime_date, crime_type)
             
             # Link cases if Identified
             if i > 0 and self.identification_status == "Identified":
                 self.trend_registry.link_cases(
-                    cases[i-1].id, case.id, "Same Victim",
-                    f"Victim {repeat_victim.full_name} targeted in both cases"
+                    cases[i-1].id, case.id, "Same Victim", link_details
                 )
         
         return cases
@@ -466,7 +691,7 @@ class TrendGenerator:
         base_location = fake.address().replace('\n', ', ')
         base_lat, base_lon = geo_mgr.get_random_city_location()
         
-        self.trend_registry.shared_entities['locations'].append({
+        self.trend_registry.entity_lists['locations'].append({
             'address': base_location,
             'lat': base_lat,
             'lon': base_lon,
@@ -474,16 +699,17 @@ class TrendGenerator:
         })
         
         config = self.TREND_TYPES["Location Pattern"]
-        start_date = datetime.now() - timedelta(days=random.randint(*config["time_span_days"]))
+        start_date = self._now - timedelta(days=random.randint(*config.time_span_days))
         
         # Use provided crime types or fall back to config defaults
-        available_crime_types = crime_types if crime_types else config["crime_types"]
+        available_crime_types = crime_types if crime_types else config.crime_types
         
         cases = []
-        for i in range(num_cases):
-            crime_type = available_crime_types[i % len(available_crime_types)]
-            crime_date = start_date + timedelta(days=i * random.randint(*config["case_spacing_days"]))
-            location_variation = geo_mgr.get_coords_in_radius(base_lat, base_lon, 0.1)
+        link_details = f"Both crimes occurred at/near {base_location}"
+        crime_dates = _sample_crime_dates(start_date, num_cases, config.case_spacing_days)
+        location_variations = geo_mgr.get_coords_in_radius_batch(base_lat, base_lon, 0.1, num_cases)
+        for i, (crime_date, crime_type, location_variation) in enumerate(
+                zip(crime_dates, cycle(available_crime_types), location_variations)):
             
             case = self._generate_related_case(
                 crime_type=crime_type,
@@ -499,15 +725,14 @@ class TrendGenerator:
             
             cases.append(case)
             # Add case ID to location entry (defensive check)
-            if self.trend_registry.shared_entities['locations']:
-                self.trend_registry.shared_entities['locations'][0]['case_ids'].append(case.id)
+            if self.trend_registry.entity_lists['locations']:
+                self.trend_registry.entity_lists['locations'][0]['case_ids'].append(case.id)
             self.trend_registry.add_to_timeline(case.id, crime_date, crime_type)
             
             # Link cases if Identified
             if i > 0 and self.identification_status == "Identified":
                 self.trend_registry.link_cases(
-                    cases[i-1].id, case.id, "Same Location",
-                    f"Both crimes occurred at/near {base_location}"
+                    cases[i-1].id, case.id, "Same Location", link_details
                 )
         
         return cases
@@ -526,14 +751,13 @@ class TrendGenerator:
         shared_victim = generate_person(Role.VICTIM, min_age=35, max_age=65)
         shared_location = fake.address().replace('\n', ', ')
         
-        start_date = datetime.now() - timedelta(days=random.randint(180, 365))
+        start_date = self._now - timedelta(days=random.randint(180, 365))
         # Use provided crime types or fall back to defaults
         available_crime_types = crime_types if crime_types else ["Burglary", "Robbery", "Fraud", "Assault", "Theft", "Burglary"]
         
         cases = []
-        for i in range(num_cases):
-            crime_type = available_crime_types[i % len(available_crime_types)]
-            crime_date = start_date + timedelta(days=i * random.randint(14, 42))
+        crime_dates = _sample_crime_dates(start_date, num_cases, (14, 42))
+        for i, (crime_date, crime_type) in enumerate(zip(crime_dates, cycle(available_crime_types))):
             pattern = random.choice(["suspect", "victim", "location", "none"])
             
             if pattern == "suspect" and random.random() < 0.6:
@@ -541,19 +765,14 @@ class TrendGenerator:
                     crime_type, complexity, modifiers, subject_status, subject_clarity,
                     shared_suspect=shared_suspect, crime_date=crime_date, case_number=i + 1
                 )
-                self.trend_registry.add_shared_suspect(shared_suspect, [case.id])
+                self.trend_registry.accumulate_suspect(shared_suspect, case.id)
             elif pattern == "victim" and random.random() < 0.5:
                 case = self._generate_related_case(
                     crime_type, complexity, modifiers, subject_status, subject_clarity,
                     shared_victim=shared_victim, crime_date=crime_date, case_number=i + 1
                 )
                 # Accumulate case IDs
-                existing_entry = next((e for e in self.trend_registry.shared_entities['victims'] 
-                                     if e['person_id'] == shared_victim.id), None)
-                if existing_entry:
-                    existing_entry['case_ids'].append(case.id)
-                else:
-                    self.trend_registry.add_shared_victim(shared_victim, [case.id])
+                self.trend_registry.accumulate_victim(shared_victim, case.id)
             elif pattern == "location":
                 case = self._generate_related_case(
                     crime_type, complexity, modifiers, subject_status, subject_clarity,
@@ -575,14 +794,36 @@ class TrendGenerator:
     def _create_equipped_suspect(self, min_age: int = 25, max_age: int = 50) -> Person:
         """Create a suspect with vehicles, devices, email, and bank accounts."""
         suspect = generate_person(Role.SUSPECT, min_age=min_age, max_age=max_age)
-        suspect.vehicles = [generate_vehicle(suspect.id, suspect.address)]
-        suspect.devices = [generate_device(suspect.id, "Phone")]
+        suspect.vehicles = [self._take_vehicle(suspect.id, suspect.address)]
+        suspect.devices = [self._take_phone(suspect.id)]
         if not suspect.email:
-            suspect.email = f"{suspect.first_name.lower()}.{suspect.last_name.lower()}@{fake.domain_name()}"
+            suspect.email = f"{suspect.first_name.lower()}.{suspect.last_name.lower()}@{random.choice(_faker_pool('domain_name'))}"
         if not suspect.bank_accounts:
-            suspect.bank_accounts = [fake.iban()]
+            suspect.bank_accounts = [random.choice(_faker_pool('iban'))]
         return suspect
     
+    def _fill_equipment_pools(self, count: int):
+        """Pre-generate the vehicles and phones for count equipped suspects of this trend."""
+        self._vehicle_pool = [generate_vehicle(None, None) for _ in range(count)]
+        self._device_pool = [generate_device(None, "Phone") for _ in range(count)]
+    
+    def _take_vehicle(self, owner_id: str, owner_address: str) -> Vehicle:
+        """Pop a pooled vehicle and assign its owner, generating one if the pool is empty."""
+        if not self._vehicle_pool:
+            return generate_vehicle(owner_id, owner_address)
+        vehicle = self._vehicle_pool.pop()
+        vehicle.owner_id = owner_id
+        vehicle.registered_address = owner_address
+        return vehicle
+    
+    def _take_phone(self, owner_id: str) -> DigitalDevice:
+        """Pop a pooled phone and assign its owner, generating one if the pool is empty."""
+        if not self._device_pool:
+            return generate_device(owner_id, "Phone")
+        device = self._device_pool.pop()
+        device.owner_id = owner_id
+        return device
+    
     def _get_suspects(self, case: Case) -> List[Person]:
         """Get all suspects from a case."""
         return [p for p in case.persons if p.role == Role.SUSPECT]
@@ -592,16 +833,15 @@ class TrendGenerator:
         return [p for p in case.persons if p.role == Role.VICTIM]
     
     def _inject_shared_suspect(self, case: Case, suspect: Person):
-        """Replace first suspect with shared suspect and copy assets."""
+        """
+        Replace first suspect with shared suspect.
+        The case holds the shared Person itself, so its vehicles and devices
+        are the suspect's own lists rather than per-case copies.
+        """
         existing = self._get_suspects(case)
         if existing:
             case.persons.remove(existing[0])
         case.add_person(suspect)
-        # Copy assets to the person in the case
-        person_in_case = next((p for p in case.persons if p.id == suspect.id), None)
-        if person_in_case:
-            person_in_case.vehicles = suspect.vehicles.copy() if suspect.vehicles else []
-            person_in_case.devices = suspect.devices.copy() if suspect.devices else []
     
     def _inject_shared_suspects(self, case: Case, suspects: List[Person]):
         """Replace all suspects with shared suspects."""
@@ -662,7 +902,7 @@ class TrendGenerator:
         
         # Override crime date
         if crime_date:
-            case.date_opened = datetime.now()
+            case.date_opened = self._now
             if case.incident_report:
                 case.incident_report.incident_date = crime_date
         
@@ -690,13 +930,7 @@ class TrendGenerator:
         if self.identification_status == "Identified":
             case.title = f"{case.title} [Trend Case #{case_number} - Linked Investigation]"
             if case_number > 1:
-                investigation_note = f"""
---- INVESTIGATION NOTE ---
-Case #{case_number} in suspected linked series.
-Investigating potential connections to previous cases.
-Pattern analysis ongoing.
-"""
-                case.documents.append(investigation_note)
+                case.documents.append(_INVEST_NOTE_TPL.format(n=case_number))
         # For Unidentified, keep original title (cases appear independent)
         
         return case
@@ -713,7 +947,7 @@ Pattern analysis ongoing.
             description=f"Master investigation file linking {len(cases)} related cases. Cases are suspected to be linked but connections require proof.",
             crime_type="Multi-Case Investigation",
             complexity="High",
-            date_opened=datetime.now(),
+            date_opened=self._now,
             status="OPEN",
             modifiers=[]
         )
@@ -725,14 +959,18 @@ Pattern analysis ongoing.
         
         # Aggregate all vehicles and link to owners
         aggregated_vehicles = self._aggregate_vehicles_across_cases(cases)
+        persons_by_id = {person.id: person for person in master_case.persons}
+        owned_vins = {}  # person id -> VINs already on that person
         for vehicle in aggregated_vehicles:
             # Find owner if owner_id is set
-            if vehicle.owner_id:
-                for person in master_case.persons:
-                    if person.id == vehicle.owner_id:
-                        if vehicle not in person.vehicles:
-                            person.vehicles.append(vehicle)
-                        break
+            owner = persons_by_id.get(vehicle.owner_id) if vehicle.owner_id else None
+            if owner:
+                vins = owned_vins.get(owner.id)
+                if vins is None:
+                    vins = owned_vins[owner.id] = {v.vin for v in owner.vehicles}
+                if vehicle.vin not in vins:
+                    vins.add(vehicle.vin)
+                    owner.vehicles.append(vehicle)
         
         # Generate master investigation document
         doc = self._build_master_investigation_document(cases)
@@ -742,59 +980,45 @@ Pattern analysis ongoing.
     
     def _aggregate_persons_across_cases(self, cases: List[Case]) -> List[Person]:
         """Aggregate persons across all cases, merging data and preserving physical descriptions."""
-        person_map = {}  # full_name -> Person
+        person_map = {}  # person.id -> Person
+        seen_items = {}  # (person.id, list attr) -> keys of the items already in that list
         
         for case in cases:
             for person in case.persons:
-                key = person.full_name.lower()
-                if key not in person_map:
+                key = person.id
+                existing = person_map.get(key)
+                if existing is None:
                     # First occurrence - add to map
                     person_map[key] = person
-                else:
-                    # Person already exists - merge data (preserve most complete data)
-                    existing = person_map[key]
-                    # Merge physical descriptions (prefer non-empty values)
-                    if not existing.height and person.height:
-                        existing.height = person.height
+                elif person is not existing:
+                    # Person already exists - merge data (preserve most complete data).
+                    # Shared suspects/victims are the same object in every case and skip this.
+                    # Fill in empty scalar fields (physical description, contact info)
+                    for attr in _MERGEABLE_ATTRS:
+                        if not getattr(existing, attr):
+                            value = getattr(person, attr)
+                            if value:
+                                setattr(existing, attr, value)
                     if not existing.weight and person.weight > 0:
                         existing.weight = person.weight
-                    if not existing.hair_color and person.hair_color:
-                        existing.hair_color = person.hair_color
-                    if not existing.eye_color and person.eye_color:
-                        existing.eye_color = person.eye_color
-                    if not existing.facial_hair and person.facial_hair:
-                        existing.facial_hair = person.facial_hair
-                    if not existing.build and person.build:
-                        existing.build = person.build
-                    if not existing.gender and person.gender:
-                        existing.gender = person.gender
-                    # Merge driver's license (prefer non-empty)
+                    # Merge driver's license (number and state travel together)
                     if not existing.driver_license_number and person.driver_license_number:
                         existing.driver_license_number = person.driver_license_number
                         existing.driver_license_state = person.driver_license_state
-                    # Merge other data
-                    if not existing.email and person.email:
-                        existing.email = person.email
-                    if not existing.address and person.address:
-                        existing.address = person.address
-                    if not existing.phone_number and person.phone_number:
-                        existing.phone_number = person.phone_number
-                    # Merge aliases
-                    for alias in person.aliases:
-                        if alias not in existing.aliases:
-                            existing.aliases.append(alias)
-                    # Merge vehicles
-                    for vehicle in person.vehicles:
-                        if vehicle not in existing.vehicles:
-                            existing.vehicles.append(vehicle)
-                    # Merge devices
-                    for device in person.devices:
-                        if device not in existing.devices:
-                            existing.devices.append(device)
-                    # Merge criminal history
-                    for history in person.criminal_history:
-                        if history not in existing.criminal_history:
-                            existing.criminal_history.append(history)
+                    # Merge aliases, vehicles, devices and criminal history
+                    for attr in _MERGEABLE_LISTS:
+                        existing_items = getattr(existing, attr)
+                        item_key = _ITEM_KEY[attr]
+                        seen = seen_items.get((key, attr))
+                        if seen is None:
+                            seen = seen_items[key, attr] = {
+                                item_key(item) if item_key else item for item in existing_items
+                            }
+                        for item in getattr(person, attr):
+                            k = item_key(item) if item_key else item
+                            if k not in seen:
+                                seen.add(k)
+                                existing_items.append(item)
         
         return list(person_map.values())
     
@@ -802,24 +1026,37 @@ Pattern analysis ongoing.
         """Aggregate vehicles across all cases."""
         vehicle_map = {}  # license_plate -> Vehicle
         
+        setdefault = vehicle_map.setdefault
         for case in cases:
             for person in case.persons:
                 for vehicle in person.vehicles:
-                    if vehicle.license_plate and vehicle.license_plate not in vehicle_map:
-                        vehicle_map[vehicle.license_plate] = vehicle
+                    plate = vehicle.license_plate
+                    if plate:
+                        setdefault(plate, vehicle)
         
         return list(vehicle_map.values())
     
     def _build_master_investigation_document(self, cases: List[Case]) -> str:
         """Build the master investigation document content."""
-        trend_id = self.trend_registry.trend_id
+        buf = io.StringIO()
+        self._write_master_investigation_document(cases, buf)
+        return buf.getvalue()
+    
+    def _write_master_investigation_document(self, cases: List[Case], out: TextIO):
+        """Write the master investigation document to out section by section."""
+        registry = self.trend_registry
+        trend_id = registry.trend_id
+        if registry.investigating_agency is None:
+            registry.investigating_agency = f"{fake.company()} Police Department"
+            registry.assigned_detectives = (f"{fake.first_name()} {fake.last_name()}, "
+                                            f"{fake.first_name()} {fake.last_name()}")
         
-        doc = f"""--- MASTER INVESTIGATION FILE ---
+        out.write(f"""--- MASTER INVESTIGATION FILE ---
 TREND ID: {trend_id}
 TREND TYPE: {self.trend_registry.trend_type}
 IDENTIFICATION STATUS: IDENTIFIED (Suspected Links - Proof Required)
-DATE CREATED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-INVESTIGATING AGENCY: {fake.company()} Police Department
+DATE CREATED: {self._now.strftime('%Y-%m-%d %H:%M:%S')}
+INVESTIGATING AGENCY: {registry.investigating_agency}
 CASE COUNT: {len(cases)} related cases
 
 ================================================================================
@@ -836,115 +1073,99 @@ necessary to prove the relationships between cases.
 
 INVESTIGATION STATUS: ACTIVE - BUILDING CASE FOR LINKAGE
 PRIORITY: HIGH
-ASSIGNED DETECTIVES: {fake.first_name()} {fake.last_name()}, {fake.first_name()} {fake.last_name()}
+ASSIGNED DETECTIVES: {registry.assigned_detectives}
 
 ================================================================================
 TIMELINE OF CASES
 ================================================================================
-"""
+""")
         
-        for i, timeline_entry in enumerate(self.trend_registry.timeline, 1):
-            doc += f"""
-{i}. CASE {timeline_entry['case_id']}
-   Date: {timeline_entry['crime_date'].strftime('%Y-%m-%d %H:%M')}
-   Type: {timeline_entry['crime_type']}
-   Status: OPEN
-"""
-        
-        doc += self._build_shared_entities_section()
-        doc += self._build_case_relationships_section()
-        doc += self._build_investigative_notes_section(cases)
+        out.writelines([
+            f"\n{i}. CASE {entry['case_id']}\n"
+            f"   Date: {entry['crime_date_str']}\n"
+            f"   Type: {entry['crime_type']}\n"
+            f"   Status: OPEN\n"
+            for i, entry in enumerate(registry.timeline, 1)
+        ])
         
-        return doc
+        out.write(self._build_shared_entities_section())
+        out.write(self._build_case_relationships_section())
+        out.write(self._build_investigative_notes_section(cases))
     
     def _build_shared_entities_section(self) -> str:
         """Build the shared entities analysis section."""
-        doc = f"""
+        parts = ["""
 ================================================================================
 SHARED ENTITIES ANALYSIS
 ================================================================================
 
 SUSPECTS APPEARING IN MULTIPLE CASES:
-"""
-        for suspect_entry in self.trend_registry.shared_entities['suspects']:
-            person = suspect_entry['person']
-            case_ids = suspect_entry['case_ids']
-            doc += f"""
-- {person.full_name} (Age: {person.age}, DOB: {fake.date_of_birth(minimum_age=person.age, maximum_age=person.age).strftime('%Y-%m-%d')})
-  Gender: {person.gender.title() if person.gender else 'Unknown'}
-  Phone: {person.phone_number}
-  Email: {person.email if person.email else 'N/A'}
-  Address: {person.address}
-  Physical Description: {person.physical_description if person.physical_description != 'Description not available' else 'Not available'}
-  Driver's License: {person.driver_license_number} ({person.driver_license_state}) if person.driver_license_number else 'Not on file'
-  Appears in Cases: {', '.join(case_ids)}
-  Vehicles: {', '.join([f'{v.year} {v.make} {v.model} ({v.license_plate})' for v in person.vehicles]) if person.vehicles else 'None'}
-  Devices: {', '.join([d.phone_number or d.imei for d in person.devices if d.phone_number or d.imei]) if person.devices else 'None'}
-"""
+"""]
+        append = parts.append
+        registry = self.trend_registry
+        for person, case_ids in zip(registry.suspects.objects, registry.suspects.case_ids):
+            device_ids = [d.phone_number or d.imei for d in person.devices if d.phone_number or d.imei]
+            append(_SUSPECT_ENTRY_TPL.format(
+                p=person,
+                dob=self._person_dob(person),
+                gender=person.gender.title() if person.gender else 'Unknown',
+                email=person.email if person.email else 'N/A',
+                cases=_format_case_ids(tuple(case_ids)),
+                vehicles=', '.join([f'{v.year} {v.make} {v.model} ({v.license_plate})' for v in person.vehicles]) if person.vehicles else 'None',
+                devices=', '.join(device_ids) if device_ids else 'None'
+            ))
         
-        if self.trend_registry.shared_entities['victims']:
-            doc += f"""
+        if registry.victims:
+            append("""
 VICTIMS APPEARING IN MULTIPLE CASES:
-"""
-            for victim_entry in self.trend_registry.shared_entities['victims']:
-                person = victim_entry['person']
-                case_ids = victim_entry['case_ids']
-                doc += f"""
-- {person.full_name}
-  Phone: {person.phone_number}
-  Appears in Cases: {', '.join(case_ids)}
-"""
+""")
+            for person, case_ids in zip(registry.victims.objects, registry.victims.case_ids):
+                append(_VICTIM_ENTRY_TPL.format(p=person, cases=_format_case_ids(tuple(case_ids))))
         
-        if self.trend_registry.shared_entities['vehicles']:
-            doc += f"""
+        if registry.vehicles:
+            append("""
 VEHICLES APPEARING IN MULTIPLE CASES:
-"""
-            for vehicle_entry in self.trend_registry.shared_entities['vehicles']:
-                vehicle = vehicle_entry['vehicle']
-                case_ids = vehicle_entry['case_ids']
-                doc += f"""
-- {vehicle.color} {vehicle.make} {vehicle.model} ({vehicle.year})
-  License Plate: {vehicle.license_plate}
-  VIN: {vehicle.vin}
-  Appears in Cases: {', '.join(case_ids)}
-"""
+""")
+            for vehicle, case_ids in zip(registry.vehicles.objects, registry.vehicles.case_ids):
+                append(_VEHICLE_ENTRY_TPL.format(v=vehicle, cases=_format_case_ids(tuple(case_ids))))
         
-        if self.trend_registry.shared_entities['devices']:
-            doc += f"""
+        if registry.devices:
+            append("""
 DEVICES APPEARING IN MULTIPLE CASES:
-"""
-            for device_entry in self.trend_registry.shared_entities['devices']:
-                device = device_entry['device']
-                case_ids = device_entry['case_ids']
-                doc += f"""
-- {device.type} - {device.make}
-  Phone: {device.phone_number or 'N/A'}
-  IMEI: {device.imei or 'N/A'}
-  IP: {device.ip_address or 'N/A'}
-  Appears in Cases: {', '.join(case_ids)}
-"""
+""")
+            for device, case_ids in zip(registry.devices.objects, registry.devices.case_ids):
+                append(_DEVICE_ENTRY_TPL.format(
+                    d=device, phone=device.phone_number or 'N/A', imei=device.imei or 'N/A',
+                    ip=device.ip_address or 'N/A', cases=_format_case_ids(tuple(case_ids))
+                ))
         
-        return doc
+        return ''.join(parts)
+    
+    def _person_dob(self, person: Person) -> str:
+        """Date of birth shown for a person in the master file, drawn once per trend."""
+        dobs = self.trend_registry.dob_by_person
+        dob = dobs.get(person.id)
+        if dob is None:
+            dob = dobs[person.id] = fake.date_of_birth(
+                minimum_age=person.age, maximum_age=person.age).strftime('%Y-%m-%d')
+        return dob
     
     def _build_case_relationships_section(self) -> str:
         """Build the case relationships section."""
-        doc = f"""
+        parts = ["""
 ================================================================================
 CASE RELATIONSHIPS
 ================================================================================
-"""
-        for rel in self.trend_registry.case_relationships:
-            doc += f"""
-- {rel['case1']} <-> {rel['case2']}
-  Connection: {rel['connection_type']}
-  Details: {rel['details']}
-"""
-        return doc
+"""]
+        parts.extend([_RELATIONSHIP_ENTRY_TPL.format_map(rel)
+                      for rel in self.trend_registry.iter_case_relationships()])
+        return ''.join(parts)
     
     def _build_investigative_notes_section(self, cases: List[Case]) -> str:
         """Build the investigative notes and next steps section."""
-        time_span = (self.trend_registry.timeline[-1]['crime_date'] - 
-                    self.trend_registry.timeline[0]['crime_date']).days if len(self.trend_registry.timeline) > 1 else 0
+        registry = self.trend_registry
+        timeline = registry.timeline
+        time_span = (timeline[-1]['crime_date'] - timeline[0]['crime_date']).days if len(timeline) > 1 else 0
         
         doc = f"""
 ================================================================================
@@ -954,10 +1175,10 @@ INVESTIGATIVE NOTES
 Pattern Analysis:
 - Total Cases: {len(cases)}
 - Time Span: {time_span} days
-- Shared Suspects: {len(self.trend_registry.shared_entities['suspects'])}
-- Shared Victims: {len(self.trend_registry.shared_entities['victims'])}
-- Shared Vehicles: {len(self.trend_registry.shared_entities['vehicles'])}
-- Shared Devices: {len(self.trend_registry.shared_entities['devices'])}
+- Shared Suspects: {len(registry.suspects)}
+- Shared Victims: {len(registry.victims)}
+- Shared Vehicles: {len(registry.vehicles)}
+- Shared Devices: {len(registry.devices)}
 
 Recommended Actions:
 1. Cross-reference all cases for additional connections
@@ -714,8 +714,8 @@ def run_trend_generation(trend_type, num_cases, complexity, modifier_nums, subje
         output += f"Trend ID: {registry.trend_id}\n"
         output += f"Total Cases: {len(cases)}\n"
         output += f"Identification Status: {identification_status}\n"
-        output += f"Shared Suspects: {len(registry.shared_entities['suspects'])}\n"
-        output += f"Case Relationships: {len(registry.case_relationships)}\n\n"
+        output += f"Shared Suspects: {len(registry.suspects)}\n"
+        output += f"Case Relationships: {registry.count_case_relationships()}\n\n"
         output += "Cases Generated:\n"
         for i, case in enumerate(cases, 1):
             output += f"  {i}. {case.title}\n"